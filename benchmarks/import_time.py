@@ -0,0 +1,78 @@
+"""
+Import time and cold start of stollen, every sample runs in a fresh interpreter.
+
+    python benchmarks/import_time.py --samples 20 --max-import-ms 250
+
+Exits with status 1 if the median exceeds the given limits, so it can guard regressions.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT = """
+from time import perf_counter
+start = perf_counter()
+import stollen
+print(perf_counter() - start)
+"""
+
+# The first client with its session and connector, as an application creates them on startup
+COLD_START = """
+import asyncio
+from time import perf_counter
+start = perf_counter()
+from stollen import Stollen
+
+async def main():
+    client = Stollen(base_url="https://example.com")
+    await client.session.get_session()
+    await client.session.close()
+
+asyncio.run(main())
+print(perf_counter() - start)
+"""
+
+
+def sample(code: str) -> float:
+    output: str = subprocess.check_output(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        text=True,
+    )
+    return float(output.strip().splitlines()[-1]) * 1000
+
+
+def measure(name: str, code: str, samples: int, limit: Optional[float]) -> bool:
+    durations: list[float] = [sample(code) for _ in range(samples)]
+    median: float = statistics.median(durations)
+    print(
+        f"{name:<12} median {median:7.1f} ms  min {min(durations):7.1f} ms  "
+        f"max {max(durations):7.1f} ms"
+    )
+    if limit is not None and median > limit:
+        print(f"{name} exceeds the limit of {limit} ms", file=sys.stderr)
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-cold-start-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    passed: bool = measure("import", IMPORT, args.samples, args.max_import_ms)
+    passed &= measure("cold start", COLD_START, args.samples, args.max_cold_start_ms)
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Validation of wide responses of nested objects: eagerly bound objects
+versus lazily bound ones, which are bound in a single pass after validation.
+
+    python benchmarks/lazy_binding.py --objects 50000
+"""
+
+import argparse
+import statistics
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from pydantic import TypeAdapter
+
+from stollen import LazyStollenObject, Stollen, StollenObject
+from stollen.utils.binding import bind_client
+
+
+class User(StollenObject[Stollen]):
+    id: int
+    name: str
+
+
+class Message(StollenObject[Stollen]):
+    id: int
+    text: str
+    user: User
+    reply_to: Optional[User] = None
+
+
+class LazyUser(LazyStollenObject[Stollen]):
+    id: int
+    name: str
+
+
+class LazyMessage(LazyStollenObject[Stollen]):
+    id: int
+    text: str
+    user: LazyUser
+    reply_to: Optional[LazyUser] = None
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    durations: list[float] = []
+    for _ in range(repeat):
+        start: float = perf_counter()
+        func()
+        durations.append(perf_counter() - start)
+    return statistics.median(durations) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client: Stollen = Stollen(base_url="https://example.com")
+    data: list[dict[str, Any]] = [
+        {
+            "id": i,
+            "text": "Hello, world!",
+            "user": {"id": i, "name": "Alice"},
+            "reply_to": {"id": i + 1, "name": "Bob"},
+        }
+        for i in range(args.objects)
+    ]
+    eager: TypeAdapter[Any] = TypeAdapter(list[Message])
+    lazy: TypeAdapter[Any] = TypeAdapter(list[LazyMessage])
+
+    def validate_eager() -> Any:
+        return eager.validate_python(data, context={"client": client})
+
+    def validate_lazy() -> Any:
+        return lazy.validate_python(data, context={"client": client})
+
+    def validate_and_bind_lazy() -> Any:
+        result: Any = validate_lazy()
+        bind_client(list[LazyMessage], result, client)
+        return result
+
+    result: Any = validate_and_bind_lazy()
+    assert result[0].user.client is client
+    validate_eager()
+
+    print(f"{args.objects} messages, {args.objects * 3} objects, median of {args.repeat}")
+    print(f"eager              {timeit(validate_eager, args.repeat):8.1f} ms")
+    print(f"lazy, unbound      {timeit(validate_lazy, args.repeat):8.1f} ms")
+    print(f"lazy, bound        {timeit(validate_and_bind_lazy, args.repeat):8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Memory held by a working set of API objects in each object profile,
+objects are validated from upstream data with an unknown field and bound to the client.
+
+    python benchmarks/memory_profiles.py --objects 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from time import perf_counter
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from stollen import CompactStollenObject, LazyStollenObject, Stollen, StollenObject
+from stollen.utils.binding import bind_client
+
+
+class User(StollenObject[Stollen]):
+    id: int
+    name: str
+    score: float
+
+
+class LazyUser(LazyStollenObject[Stollen]):
+    id: int
+    name: str
+    score: float
+
+
+class CompactUser(CompactStollenObject[Stollen]):
+    id: int
+    name: str
+    score: float
+
+
+PROFILES: dict[str, type[Any]] = {
+    "StollenObject": User,
+    "LazyStollenObject": LazyUser,
+    "CompactStollenObject": CompactUser,
+}
+
+
+def measure(model: type[Any], data: list[dict[str, Any]], client: Stollen) -> tuple[int, float]:
+    adapter: TypeAdapter[Any] = TypeAdapter(list[model])  # type: ignore[valid-type]
+    adapter.validate_python(data[:1], context={"client": client})
+    gc.collect()
+    tracemalloc.start()
+    start: float = perf_counter()
+    result: Any = adapter.validate_python(data, context={"client": client})
+    bind_client(list[model], result, client)  # type: ignore[valid-type]
+    duration: float = perf_counter() - start
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert result[-1].client is client
+    del result
+    return size, duration
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--objects", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    client: Stollen = Stollen(base_url="https://example.com")
+    # Ids and scores are distinct objects, just like in parsed JSON
+    data: list[dict[str, Any]] = [
+        {"id": 1_000_000 + i, "name": "Alice", "score": i / 3, "added_upstream": True}
+        for i in range(args.objects)
+    ]
+
+    print(f"{args.objects} objects (tracemalloc slows validation down)")
+    baseline: int = 0
+    for name, model in PROFILES.items():
+        size, duration = measure(model, data, client)
+        baseline = baseline or size
+        print(
+            f"{name:<22} {size / 2**20:8.1f} MiB  {size / args.objects:6.0f} B/object  "
+            f"x{baseline / size:4.2f}  {duration:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
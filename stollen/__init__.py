@@ -1,6 +1,21 @@
 from .__meta__ import __version__
 from .client import Stollen
 from .method import StollenMethod
-from .object import MutableStollenObject, StollenObject
+from .object import (
+    CompactStollenObject,
+    LazyMutableStollenObject,
+    LazyStollenObject,
+    MutableStollenObject,
+    StollenObject,
+)
 
-__all__ = ["__version__", "MutableStollenObject", "Stollen", "StollenMethod", "StollenObject"]
+__all__ = [
+    "__version__",
+    "CompactStollenObject",
+    "LazyMutableStollenObject",
+    "LazyStollenObject",
+    "MutableStollenObject",
+    "Stollen",
+    "StollenMethod",
+    "StollenObject",
+]
@@ -1,20 +1,38 @@
 from __future__ import annotations
 
+from functools import partial
 from types import TracebackType
-from typing import TYPE_CHECKING, Iterable, Optional, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Literal,
+    Optional,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from typing_extensions import Self
 
+from ..const import DEFAULT_BATCH_CONCURRENCY
 from ..exceptions import StollenAPIError, StollenError
 from ..requests import StollenRequest, StollenResponse
-from ..session.aiohttp import AiohttpSession
+from ..session.pagination import DEFAULT_PREFETCH, Paginator
+from ..utils.concurrency import map_bounded
 
 if TYPE_CHECKING:
     from ..method import StollenMethod
     from ..requests.factory import RequestFieldFactory
     from ..requests.fields import RequestField
+    from ..session.access_log import LogSampling
     from ..session.base import BaseSession
+    from ..session.retry import RetryPolicy
+    from ..session.stats import StatsSnapshot
     from ..types import StollenT
+    from ..utils.interning import InternPool
 
 
 class Stollen:
@@ -29,7 +47,12 @@ class Stollen:
     force_detailed_errors: bool
     stringify_detailed_errors: bool
     echo_requests: bool
+    log_sampling: Optional[LogSampling]
     hide_headers: list[str]
+    coalesce_requests: bool
+    retry_policy: Optional[RetryPolicy]
+    trust_responses: bool
+    intern_objects: Union[bool, InternPool]
 
     def __init__(
         self,
@@ -45,9 +68,17 @@ class Stollen:
         force_detailed_errors: bool = False,
         stringify_detailed_errors: bool = True,
         echo_requests: bool = True,
+        log_sampling: Optional[LogSampling] = None,
         hide_headers: Optional[list[str]] = None,
+        coalesce_requests: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        trust_responses: bool = False,
+        intern_objects: Union[bool, InternPool] = False,
     ) -> None:
         if session is None:
+            # aiohttp is imported only if it's actually used
+            from ..session.aiohttp import AiohttpSession
+
             session = AiohttpSession()
         self.session = session
         self.base_url = base_url
@@ -60,7 +91,12 @@ class Stollen:
         self.force_detailed_errors = force_detailed_errors
         self.stringify_detailed_errors = stringify_detailed_errors
         self.echo_requests = echo_requests
+        self.log_sampling = log_sampling
         self.hide_headers = hide_headers or []
+        self.coalesce_requests = coalesce_requests
+        self.retry_policy = retry_policy
+        self.trust_responses = trust_responses
+        self.intern_objects = intern_objects
 
     def stollen_get_subdomain(
         self,
@@ -79,6 +115,165 @@ class Stollen:
             request_timeout=request_timeout,
         )
 
+    @overload
+    async def gather(
+        self,
+        methods: Union[
+            Iterable[StollenMethod[StollenT, StollenClientT]],
+            AsyncIterable[StollenMethod[StollenT, StollenClientT]],
+        ],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: Literal[False] = False,
+        request_timeout: Optional[int] = None,
+    ) -> list[StollenT]: ...
+
+    @overload
+    async def gather(
+        self,
+        methods: Union[
+            Iterable[StollenMethod[StollenT, StollenClientT]],
+            AsyncIterable[StollenMethod[StollenT, StollenClientT]],
+        ],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: Literal[True],
+        request_timeout: Optional[int] = None,
+    ) -> list[Union[StollenT, Exception]]: ...
+
+    async def gather(
+        self,
+        methods: Union[
+            Iterable[StollenMethod[StollenT, StollenClientT]],
+            AsyncIterable[StollenMethod[StollenT, StollenClientT]],
+        ],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: bool = False,
+        request_timeout: Optional[int] = None,
+    ) -> Union[list[StollenT], list[Union[StollenT, Exception]]]:
+        """
+        Call methods with at most ``concurrency`` requests in flight
+        and return their results in the order of the methods.
+
+        :param methods: Iterable (or async iterable) of methods, consumed lazily.
+        :param concurrency: Maximum number of simultaneous requests.
+        :param return_exceptions: Put exceptions into results instead of raising the first one.
+        :param request_timeout: Request timeout for every call.
+        """
+        results: list[Any] = []
+        async for index, _, result in map_bounded(
+            partial(self, request_timeout=request_timeout),
+            methods,
+            limit=concurrency,
+            return_exceptions=return_exceptions,
+        ):
+            results.extend([None] * (index + 1 - len(results)))
+            results[index] = result
+        return results
+
+    @overload
+    def map_concurrent(
+        self,
+        methods: Union[
+            Iterable[StollenMethod[StollenT, StollenClientT]],
+            AsyncIterable[StollenMethod[StollenT, StollenClientT]],
+        ],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: Literal[False] = False,
+        request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[tuple[StollenMethod[StollenT, StollenClientT], StollenT]]: ...
+
+    @overload
+    def map_concurrent(
+        self,
+        methods: Union[
+            Iterable[StollenMethod[StollenT, StollenClientT]],
+            AsyncIterable[StollenMethod[StollenT, StollenClientT]],
+        ],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: Literal[True],
+        request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[
+        tuple[StollenMethod[StollenT, StollenClientT], Union[StollenT, Exception]]
+    ]: ...
+
+    async def map_concurrent(
+        self,
+        methods: Union[
+            Iterable[StollenMethod[StollenT, StollenClientT]],
+            AsyncIterable[StollenMethod[StollenT, StollenClientT]],
+        ],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: bool = False,
+        request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[tuple[StollenMethod[StollenT, StollenClientT], Any]]:
+        """
+        Call methods with at most ``concurrency`` requests in flight
+        and yield ``(method, result)`` pairs as soon as calls complete.
+
+        :param methods: Iterable (or async iterable) of methods, consumed lazily.
+        :param concurrency: Maximum number of simultaneous requests.
+        :param return_exceptions: Yield exceptions as results instead of raising them.
+        :param request_timeout: Request timeout for every call.
+        """
+        async for _, method, result in map_bounded(
+            partial(self, request_timeout=request_timeout),
+            methods,
+            limit=concurrency,
+            return_exceptions=return_exceptions,
+        ):
+            yield method, result
+
+    def paginate(
+        self,
+        method: StollenMethod[Any, StollenClientT],
+        *,
+        prefetch: int = DEFAULT_PREFETCH,
+        max_pages: Optional[int] = None,
+        request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over items of all pages of the method declared with ``pagination``.
+        Up to ``prefetch`` next pages are requested concurrently
+        while the current one is consumed, iteration stops on the first empty page.
+
+        :param method: Method of the first page.
+        :param prefetch: Maximum number of pages in flight.
+        :param max_pages: Maximum number of pages to fetch.
+        :param request_timeout: Request timeout for every page.
+        """
+        paginator: Paginator = Paginator(
+            client=self,
+            method=method,
+            prefetch=prefetch,
+            max_pages=max_pages,
+            request_timeout=request_timeout,
+        )
+        return paginator.__aiter__()
+
+    def stream_items(
+        self,
+        method: StollenMethod[Any, StollenClientT],
+        request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Call the method returning an array (e.g. ``returning=list[Item]``)
+        and yield its validated items while the response is being received.
+        The array is looked up by ``response_data_key``, just like for regular calls.
+
+        :param method: Method returning an array.
+        :param request_timeout: Idle timeout of the response.
+        """
+        return self.session.stream_items(
+            client=self,
+            method=method,
+            request_timeout=request_timeout,
+        )
+
     async def raw_request(
         self,
         request: StollenRequest,
@@ -91,6 +286,13 @@ class Stollen:
         )
         return response
 
+    def stats(self) -> StatsSnapshot:
+        """
+        Snapshot of request statistics and connection pool state of the session.
+        Requires the session to be created with ``stats``.
+        """
+        return self.session.get_stats()
+
     async def __aenter__(self) -> Self:
         return self
 
@@ -24,3 +24,28 @@ class StollenContextController(BaseModel, Generic[StollenClientT]):
     @property
     def client(self) -> Optional[StollenClientT]:
         return self._client
+
+
+class LazyStollenContextController(BaseModel, Generic[StollenClientT]):
+    """
+    Context controller, that isn't bound to the client during validation,
+    so that nested objects of large responses don't cost a Python call each.
+    Instead, objects of the response are bound after validation in a single pass,
+    sharing the same private attributes (see :func:`stollen.utils.binding.bind_client`).
+    """
+
+    def as_(self, client: Optional[StollenClientT]) -> Self:
+        """
+        Bind object to a stollen instance.
+        """
+        # Private attributes may be shared by the whole response, so they are replaced
+        object.__setattr__(self, "__pydantic_private__", {"_client": client})
+        return self
+
+    @property
+    def client(self) -> Optional[StollenClientT]:
+        private: Optional[dict[str, Any]] = self.__pydantic_private__
+        if private is None:
+            return None
+        client: Optional[StollenClientT] = private.get("_client")
+        return client
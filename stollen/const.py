@@ -2,3 +2,6 @@ from typing import Final
 
 DEFAULT_REQUEST_TIMEOUT: Final[int] = 30
 DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024
+DEFAULT_READ_BUFFER_SIZE: Final[int] = 1024 * 1024
+DEFAULT_SPOOL_MAX_SIZE: Final[int] = 8 * 1024 * 1024
+DEFAULT_BATCH_CONCURRENCY: Final[int] = 10
@@ -1,4 +1,5 @@
 from .http_method import HTTPMethod
 from .request_field_type import RequestFieldType
+from .stream_mode import StreamMode
 
-__all__ = ["HTTPMethod", "RequestFieldType"]
+__all__ = ["HTTPMethod", "RequestFieldType", "StreamMode"]
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from enum import Enum
 
 
@@ -10,3 +12,14 @@ class HTTPMethod(str, Enum):
     POST = "POST"
     PUT = "PUT"
     TRACE = "TRACE"
+
+    @classmethod
+    def is_idempotent(cls, http_method: str) -> bool:
+        return http_method in {
+            HTTPMethod.HEAD,
+            HTTPMethod.GET,
+            HTTPMethod.DELETE,
+            HTTPMethod.OPTIONS,
+            HTTPMethod.PUT,
+            HTTPMethod.TRACE,
+        }
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class StreamMode(str, Enum):
+    # Whole response is buffered in memory
+    MEMORY = "memory"
+    # Response is buffered in memory and rolled to a temporary file above the threshold
+    SPOOLED = "spooled"
+    # Response is read from the live connection while it's being consumed
+    LIVE = "live"
@@ -1,20 +1,38 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, Generator, Generic, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic import BaseModel, ConfigDict, PydanticUserError, TypeAdapter
 
 from .client import StollenClientT
 from .client.context_controller import StollenContextController
-from .const import DEFAULT_CHUNK_SIZE
-from .enums import HTTPMethod, RequestFieldType
+from .const import DEFAULT_CHUNK_SIZE, DEFAULT_SPOOL_MAX_SIZE
+from .enums import HTTPMethod, RequestFieldType, StreamMode
 from .requests import FileResponse
+from .session.download import Downloader
 from .types import StollenT
 
 if TYPE_CHECKING:
+    from .session.pagination import Pagination
+    from .session.retry import RetryPolicy
     from .types import HTTPMethodType
 
 
+def build_type_adapter(returning: Any) -> TypeAdapter[Any]:
+    """
+    Create the adapter, that builds its schema on the first validation
+    (or on :func:`stollen.utils.warmup.warmup_schemas`) instead of the import time.
+    """
+    try:
+        return TypeAdapter(returning, config=ConfigDict(defer_build=True))
+    except PydanticUserError as error:
+        if error.code != "type-adapter-config-unused":
+            raise
+        # Models, dataclasses and typed dicts are deferred by their own config
+        return TypeAdapter(returning)
+
+
 class StollenMethod(
     StollenContextController[StollenClientT],
     BaseModel,
@@ -26,13 +44,17 @@ class StollenMethod(
     returning: ClassVar[type[Any]]
     response_data_key: ClassVar[list[str]]
     default_field_type: ClassVar[RequestFieldType]
+    cache_ttl: ClassVar[Optional[float]]
+    retry_policy: ClassVar[Optional[RetryPolicy]]
+    trusted: ClassVar[Optional[bool]]
+    pagination: ClassVar[Optional[Pagination]]
     type_adapter: ClassVar[TypeAdapter[Any]]
     __abstract: ClassVar[bool] = False
 
     async def emit(self, client: StollenClientT) -> StollenT:
         return await client(self)
 
-    def __await__(self) -> Generator[Any, None, StollenT]:
+    def _get_client(self) -> StollenClientT:
         client: Optional[StollenClientT] = self._client
         if not client:
             raise RuntimeError(
@@ -41,7 +63,10 @@ class StollenMethod(
                 "or mount method to a stollen instance `method.as_(stollen)` "
                 "and then call it `await method()`"
             )
-        return self.emit(client).__await__()
+        return client
+
+    def __await__(self) -> Generator[Any, None, StollenT]:
+        return self.emit(self._get_client()).__await__()
 
     @classmethod
     def __validate_class_var(
@@ -83,8 +108,12 @@ class StollenMethod(
                 kwargs=kwargs,
                 default=RequestFieldType.AUTO,
             )
+            cls.__validate_class_var(name="cache_ttl", kwargs=kwargs, required=False)
+            cls.__validate_class_var(name="retry_policy", kwargs=kwargs, required=False)
+            cls.__validate_class_var(name="trusted", kwargs=kwargs, required=False)
+            cls.__validate_class_var(name="pagination", kwargs=kwargs, required=False)
             if getattr(cls, "returning", None):
-                cls.type_adapter = TypeAdapter[StollenT](cls.returning)
+                cls.type_adapter = build_type_adapter(cls.returning)
             # Set extra class vars if needed
             for name in kwargs.copy():
                 if name in cls.__class_vars__:
@@ -94,6 +123,7 @@ class StollenMethod(
     model_config = ConfigDict(
         validate_assignment=True,
         arbitrary_types_allowed=True,
+        defer_build=True,
     )
 
 
@@ -104,6 +134,44 @@ class StollenStreamingMethod(
 ):
     """
     Abstract class for methods with streaming response
+
+    ``stream_mode`` defines where the response content goes:
+    into memory, into memory rolled to a temporary file above ``spool_max_size`` bytes,
+    or nowhere until it's read from the live connection.
+    Live responses hold the connection until they are read or closed.
     """
 
     chunk_size: ClassVar[int] = DEFAULT_CHUNK_SIZE
+    stream_mode: ClassVar[StreamMode] = StreamMode.MEMORY
+    spool_max_size: ClassVar[int] = DEFAULT_SPOOL_MAX_SIZE
+
+    async def download_to(
+        self,
+        path: Union[str, Path],
+        *,
+        segments: int = 1,
+        client: Optional[StollenClientT] = None,
+        request_timeout: Optional[int] = None,
+    ) -> int:
+        """
+        Download the content right into the file.
+
+        The file is preallocated and up to ``segments`` byte ranges are fetched concurrently
+        over separate connections, falling back to a single stream
+        when the server doesn't support ranges.
+        Segments interrupted by a dropped connection are resumed from the last written byte.
+
+        :param path: Path to the target file.
+        :param segments: Number of concurrent range requests.
+        :param client: Stollen instance, bound one is used by default.
+        :param request_timeout: Request timeout of every range request.
+        :return: Number of downloaded bytes.
+        """
+        downloader: Downloader = Downloader(
+            client=client or self._get_client(),
+            method=self,
+            path=path,
+            segments=segments,
+            request_timeout=request_timeout,
+        )
+        return await downloader.download()
@@ -1,20 +1,57 @@
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict
 
 from .client import StollenClientT
-from .client.context_controller import StollenContextController
+from .client.context_controller import LazyStollenContextController, StollenContextController
+
+_OBJECT_CONFIG = ConfigDict(
+    use_enum_values=True,
+    extra="allow",
+    validate_assignment=True,
+    frozen=True,
+    populate_by_name=True,
+    arbitrary_types_allowed=True,
+    defer_build=True,
+)
 
 
 class StollenObject(StollenContextController[StollenClientT], BaseModel):
-    model_config = ConfigDict(
-        use_enum_values=True,
-        extra="allow",
-        validate_assignment=True,
-        frozen=True,
-        populate_by_name=True,
-        arbitrary_types_allowed=True,
-        defer_build=True,
-    )
+    model_config = _OBJECT_CONFIG
 
 
 class MutableStollenObject(StollenObject[StollenClientT]):
     model_config = ConfigDict(frozen=False)
+
+
+class LazyStollenObject(LazyStollenContextController[StollenClientT], BaseModel):
+    """
+    Object, that isn't bound to the client during validation, so that validation
+    of large responses skips a Python-level hook per object.
+    Objects of the response are bound afterwards in a single pass.
+    """
+
+    model_config = _OBJECT_CONFIG
+
+
+class LazyMutableStollenObject(LazyStollenObject[StollenClientT]):
+    model_config = ConfigDict(frozen=False)
+
+
+class CompactStollenObject(LazyStollenObject[StollenClientT]):
+    """
+    Object profile for large working sets, that keeps only what's declared:
+    unknown fields are ignored, the client is bound lazily
+    and objects of the same type, that have the same fields set,
+    share the set of their names, once they're bound to the client of the response.
+    Compact objects are always frozen, so that shared sets are never modified.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        if not cls.model_config.get("frozen"):
+            msg: str = f"Compact object `{cls.__name__}` must be frozen!"
+            raise TypeError(msg)
@@ -10,7 +10,15 @@ from .fields import (
     RequestField,
     request_field,
 )
-from .input_file import BufferedInputFile, FSInputFile, InputFile
+from .input_file import BufferedInputFile, FSInputFile, InputFile, MMapInputFile
+from .json_backend import (
+    CallableJsonBackend,
+    JsonBackend,
+    MsgspecBackend,
+    OrjsonBackend,
+    StdlibJsonBackend,
+    detect_json_backend,
+)
 from .serializer import RequestSerializer
 from .types import FileResponse, StollenRequest, StollenResponse
 
@@ -18,18 +26,25 @@ __all__ = [
     "Body",
     "BodyField",
     "BufferedInputFile",
+    "CallableJsonBackend",
     "FSInputFile",
     "FileResponse",
     "Header",
     "HeaderField",
     "InputFile",
+    "JsonBackend",
+    "MMapInputFile",
+    "MsgspecBackend",
+    "OrjsonBackend",
     "Placeholder",
     "PlaceholderField",
     "Query",
     "QueryField",
     "RequestField",
     "RequestSerializer",
+    "StdlibJsonBackend",
     "StollenRequest",
     "StollenResponse",
+    "detect_json_backend",
     "request_field",
 ]
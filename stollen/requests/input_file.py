@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import io
+import asyncio
+import mmap
 import os
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING, AsyncGenerator, Optional, Union
 
-import aiofiles
-
-from ..const import DEFAULT_CHUNK_SIZE
+from ..const import DEFAULT_CHUNK_SIZE, DEFAULT_READ_BUFFER_SIZE
 
 if TYPE_CHECKING:
     from ..client import Stollen
@@ -50,6 +50,11 @@ class BufferedInputFile(InputFile):
         """
         Create buffer from file
 
+        The whole file is read synchronously, blocking the event loop,
+        so :meth:`from_file_async` should be used in coroutines.
+        Uploads don't need the buffer at all:
+        :obj:`FSInputFile` and :obj:`MMapInputFile` read the file while it's sent.
+
         :param path: Path to file
         :param filename: Filename to be propagated to telegram.
             By default, will be parsed from path
@@ -62,10 +67,29 @@ class BufferedInputFile(InputFile):
             data = f.read()
         return cls(data, filename=filename, chunk_size=chunk_size)
 
+    @classmethod
+    async def from_file_async(
+        cls,
+        path: Union[str, Path],
+        filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> BufferedInputFile:
+        """
+        Same as :meth:`from_file`, but the file is read in a thread
+
+        :param path: Path to file
+        :param filename: Filename to be propagated to telegram.
+            By default, will be parsed from path
+        :param chunk_size: Uploading chunk size
+        :return: instance of :obj:`BufferedInputFile`
+        """
+        return await asyncio.to_thread(cls.from_file, path, filename, chunk_size)
+
     async def read(self, client: Stollen) -> AsyncGenerator[bytes, None]:
-        buffer = io.BytesIO(self.data)
-        while chunk := buffer.read(self.chunk_size):
-            yield chunk
+        # Slices of memoryview share the buffer, so chunks are not copied
+        view: memoryview = memoryview(self.data)
+        for offset in range(0, len(view), self.chunk_size):
+            yield view[offset : offset + self.chunk_size]
 
 
 class FSInputFile(InputFile):
@@ -74,6 +98,7 @@ class FSInputFile(InputFile):
         path: Union[str, Path],
         filename: Optional[str] = None,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
+        buffer_size: int = DEFAULT_READ_BUFFER_SIZE,
     ) -> None:
         """
         Represents object for uploading files from filesystem
@@ -82,13 +107,66 @@ class FSInputFile(InputFile):
         :param filename: Filename to be propagated to telegram.
             By default, will be parsed from path
         :param chunk_size: Uploading chunk size
+        :param buffer_size: Size of a single read from the file,
+            it's split into chunks without copying
         """
         if filename is None:
             filename = os.path.basename(path)
         super().__init__(filename=filename, chunk_size=chunk_size)
         self.path = path
+        self.buffer_size = max(buffer_size, chunk_size)
 
     async def read(self, client: Stollen) -> AsyncGenerator[bytes, None]:
+        import aiofiles
+
         async with aiofiles.open(self.path, "rb") as f:
-            while chunk := await f.read(self.chunk_size):
-                yield chunk
+            while buffer := await f.read(self.buffer_size):
+                view: memoryview = memoryview(buffer)
+                for offset in range(0, len(view), self.chunk_size):
+                    yield view[offset : offset + self.chunk_size]
+
+
+def _map_file(path: Union[str, Path]) -> Optional[mmap.mmap]:
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return None
+        mapping: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mapping, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+    return mapping
+
+
+class MMapInputFile(InputFile):
+    def __init__(
+        self,
+        path: Union[str, Path],
+        filename: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Represents object for uploading large files from filesystem,
+        the file is memory-mapped and its chunks are sent without copying
+
+        :param path: Path to file
+        :param filename: Filename to be propagated to telegram.
+            By default, will be parsed from path
+        :param chunk_size: Uploading chunk size
+        """
+        if filename is None:
+            filename = os.path.basename(path)
+        super().__init__(filename=filename, chunk_size=chunk_size)
+        self.path = path
+
+    async def read(self, client: Stollen) -> AsyncGenerator[bytes, None]:
+        mapping: Optional[mmap.mmap] = await asyncio.to_thread(_map_file, self.path)
+        if mapping is None:
+            return
+        try:
+            view: memoryview = memoryview(mapping)
+            for offset in range(0, len(view), self.chunk_size):
+                yield view[offset : offset + self.chunk_size]
+            del view
+        finally:
+            # Chunks may still be referenced, then the mapping is closed once they are released
+            with suppress(BufferError):
+                mapping.close()
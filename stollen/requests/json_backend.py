@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Union
+
+if TYPE_CHECKING:
+    from ..types import JsonDumps, JsonLoads
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonBackend(ABC):
+    """
+    JSON encoder and decoder working on bytes on both sides,
+    so that request bodies and responses are never converted to text and back.
+    """
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: JsonInput) -> Any:
+        pass
+
+    def dumps_text(self, obj: Any) -> str:
+        return self.dumps(obj).decode()
+
+
+class StdlibJsonBackend(JsonBackend):
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    def loads(self, data: JsonInput) -> Any:
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+    def dumps_text(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+
+class OrjsonBackend(JsonBackend):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        # Functions are kept instead of the module, so that the backend can be pickled
+        self._dumps = partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: JsonInput) -> Any:
+        return self._loads(data)
+
+
+class MsgspecBackend(JsonBackend):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # type: ignore
+
+        self._dumps: Callable[[Any], bytes] = msgspec.json.encode
+        self._loads: Callable[[JsonInput], Any] = msgspec.json.decode
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj)
+
+    def loads(self, data: JsonInput) -> Any:
+        return self._loads(data)
+
+
+class CallableJsonBackend(JsonBackend):
+    """
+    Backend for the custom ``json_loads`` and ``json_dumps`` working on text.
+    """
+
+    name = "custom"
+
+    def __init__(self, loads: JsonLoads = json.loads, dumps: JsonDumps = json.dumps) -> None:
+        self._loads = loads
+        self._dumps = dumps
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._dumps(obj).encode()
+
+    def loads(self, data: JsonInput) -> Any:
+        return self._loads(data if isinstance(data, str) else bytes(data).decode())
+
+    def dumps_text(self, obj: Any) -> str:
+        return self._dumps(obj)
+
+
+_BACKENDS: tuple[type[JsonBackend], ...] = (OrjsonBackend, MsgspecBackend, StdlibJsonBackend)
+
+
+@lru_cache(maxsize=1)
+def detect_json_backend() -> JsonBackend:
+    """
+    Get the fastest installed backend: orjson, msgspec or the standard json module.
+    """
+    for backend_type in _BACKENDS:
+        try:
+            return backend_type()
+        except ImportError:
+            continue
+    return StdlibJsonBackend()
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from string import Formatter
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydantic import RootModel
+
+from ..const import DEFAULT_CHUNK_SIZE, DEFAULT_SPOOL_MAX_SIZE
+from ..enums import RequestFieldType, StreamMode
+from .types import FileResponse
+
+if TYPE_CHECKING:
+    from ..method import StollenMethod
+    from .factory import AnyValueFactory
+
+_PLAN_ATTRIBUTE = "__stollen_serialization_plan__"
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    name: str
+    key: str
+    field_type: str
+    field_factory: Optional[AnyValueFactory]
+    placeholder: bool
+
+
+@dataclass(frozen=True)
+class SerializationPlan:
+    """
+    Everything the serializer needs to know about a method class,
+    computed once and reused for every call of that method.
+    """
+
+    default_field_type: str
+    is_root: bool
+    fields: tuple[FieldPlan, ...]
+    stream_content: bool
+    stream_chunk_size: Optional[int]
+    stream_mode: str
+    stream_spool_max_size: Optional[int]
+
+    @classmethod
+    def build(cls, method_type: type[StollenMethod[Any, Any]]) -> SerializationPlan:
+        default_field_type: str = (
+            method_type.default_field_type
+            if method_type.default_field_type != RequestFieldType.AUTO
+            else RequestFieldType.resolve(http_method=method_type.http_method)
+        )
+        placeholders: set[str] = {
+            name for _, name, _, _ in Formatter().parse(method_type.api_method) if name
+        }
+
+        fields: list[FieldPlan] = []
+        for name, field in method_type.model_fields.items():
+            extra: dict[str, Any] = (
+                field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+            )
+            key: str = field.serialization_alias or field.alias or name
+            fields.append(
+                FieldPlan(
+                    name=name,
+                    key=key,
+                    field_type=extra.get("field_type", default_field_type),
+                    field_factory=extra.get("field_factory"),
+                    placeholder=key in placeholders,
+                )
+            )
+
+        try:
+            stream_content: bool = issubclass(method_type.returning, FileResponse)
+        except TypeError:
+            stream_content = False
+
+        return cls(
+            default_field_type=default_field_type,
+            is_root=issubclass(method_type, RootModel),
+            fields=tuple(fields),
+            stream_content=stream_content,
+            stream_chunk_size=(
+                getattr(method_type, "chunk_size", DEFAULT_CHUNK_SIZE) if stream_content else None
+            ),
+            stream_mode=getattr(method_type, "stream_mode", StreamMode.MEMORY),
+            stream_spool_max_size=(
+                getattr(method_type, "spool_max_size", DEFAULT_SPOOL_MAX_SIZE)
+                if stream_content
+                else None
+            ),
+        )
+
+
+def get_serialization_plan(method_type: type[StollenMethod[Any, Any]]) -> SerializationPlan:
+    # Looking into the class namespace directly, so subclasses never reuse the parent plan
+    plan: Optional[SerializationPlan] = method_type.__dict__.get(_PLAN_ATTRIBUTE)
+    if plan is None:
+        plan = SerializationPlan.build(method_type)
+        setattr(method_type, _PLAN_ATTRIBUTE, plan)
+    return plan
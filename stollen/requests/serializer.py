@@ -1,28 +1,25 @@
 from __future__ import annotations
 
-import json
 from typing import TYPE_CHECKING, Any, Iterable, Optional, cast
 
-from pydantic import BaseModel, RootModel
+from pydantic import BaseModel
 
-# noinspection PyProtectedMember
-from pydantic.fields import FieldInfo
-
-from ..const import DEFAULT_CHUNK_SIZE
 from ..enums import RequestFieldType
 from ..requests.fields import RequestField
 from ..requests.input_file import InputFile
 from ..requests.types import StollenRequest
-from .types import FileResponse
+from .json_backend import CallableJsonBackend, JsonBackend, detect_json_backend
+from .plan import FieldPlan, SerializationPlan, get_serialization_plan
+from .url import URLTemplate, compile_method_url, compile_url
 
 if TYPE_CHECKING:
     from ..client import Stollen, StollenClientT
     from ..method import StollenMethod
-    from ..requests.factory import RequestFieldFactory
     from ..types import JsonDumps, JsonLoads, StollenT
 
 
 class RequestSerializer:
+    json_backend: JsonBackend
     json_loads: JsonLoads
     json_dumps: JsonDumps
     exclude_defaults: bool
@@ -30,69 +27,71 @@ class RequestSerializer:
     def __init__(
         self,
         *,
-        json_loads: JsonLoads = json.loads,
-        json_dumps: JsonDumps = json.dumps,
+        json_loads: Optional[JsonLoads] = None,
+        json_dumps: Optional[JsonDumps] = None,
+        json_backend: Optional[JsonBackend] = None,
         exclude_defaults: bool = True,
     ) -> None:
-        self.json_loads = json_loads
-        self.json_dumps = json_dumps
+        """
+        :param json_loads: Custom function decoding JSON text.
+        :param json_dumps: Custom function encoding JSON text.
+        :param json_backend: JSON backend working on bytes.
+            By default, orjson or msgspec is used if installed,
+            unless custom ``json_loads`` or ``json_dumps`` is given.
+        :param exclude_defaults: Exclude fields with default values from requests.
+        """
+        if json_backend is None:
+            json_backend = (
+                CallableJsonBackend(
+                    **{
+                        name: func
+                        for name, func in (("loads", json_loads), ("dumps", json_dumps))
+                        if func is not None
+                    }
+                )
+                if json_loads is not None or json_dumps is not None
+                else detect_json_backend()
+            )
+        self.json_backend = json_backend
+        self.json_loads = json_loads or json_backend.loads
+        self.json_dumps = json_dumps or json_backend.dumps_text
         self.exclude_defaults = exclude_defaults
 
     @classmethod
     def format_url(cls, url: str, payload: dict[str, dict[str, Any]]) -> str:
-        to_format: dict[str, Any] = {}
-        for data in payload.values():
-            for key in data.copy():
-                if f"{{{key}}}" in url:
-                    to_format[key] = data.pop(key)
-        return url.format(**to_format)
+        template: URLTemplate = compile_url(url)
+        return template.render(template.pop_values(payload))
 
     def _prepare_field(
         self,
         client: Stollen,
         method: StollenMethod[StollenT, StollenClientT],
-        default_field_type: str,
-        field: FieldInfo,
+        field: FieldPlan,
         field_value: Any,
-    ) -> tuple[str, Any]:
-        field_type = cast(
-            str,
-            (
-                field.json_schema_extra.get("field_type", default_field_type)
-                if isinstance(field.json_schema_extra, dict)
-                else default_field_type
-            ),
-        )
-
+    ) -> Any:
         if field_value is None:
-            field_factory: Optional[RequestFieldFactory] = (
-                field.json_schema_extra.get("field_factory")  # type: ignore[assignment]
-                if isinstance(field.json_schema_extra, dict)
-                else None
-            )
-
-            if field_factory is not None:
-                field_value = field_factory(client, method)  # type: ignore[arg-type]
+            if field.field_factory is not None:
+                field_value = field.field_factory(client, method)  # type: ignore[arg-type]
 
             if isinstance(field_value, BaseModel):
                 field_value = field_value.model_dump(exclude_defaults=self.exclude_defaults)
 
             if field_value is None:
-                return field_type, None
+                return None
 
-        if field_type == RequestFieldType.QUERY and not isinstance(
+        if field.field_type == RequestFieldType.QUERY and not isinstance(
             field_value,
             (str, int, float),
         ):
             field_value = self.json_dumps(field_value)
 
-        return field_type, field_value
+        return field_value
 
     def _prepare_method_fields(
         self,
         client: Stollen,
         method: StollenMethod[StollenT, StollenClientT],
-        default_field_type: str,
+        plan: SerializationPlan,
         payload: dict[str, dict[str, Any]],
     ) -> dict[str, Any]:
         dump: dict[str, Any] = method.model_dump(
@@ -100,26 +99,25 @@ class RequestSerializer:
             exclude_defaults=self.exclude_defaults,
         )
 
-        for name, field in method.model_fields.items():
-            key: str = field.serialization_alias or field.alias or name
-
-            field_value = dump.get(key)
+        for field in plan.fields:
+            field_value = dump.get(field.key)
             if isinstance(field_value, InputFile):
-                payload[RequestFieldType.FILE][key] = field_value
+                payload[RequestFieldType.FILE][field.key] = field_value
                 continue
 
-            field_type, field_value = self._prepare_field(
+            field_value = self._prepare_field(
                 client=client,
                 method=method,
-                default_field_type=default_field_type,
                 field=field,
                 field_value=field_value,
             )
             if field_value is None and self.exclude_defaults:
                 continue
 
-            fields = payload.setdefault(field_type, {})
-            fields[key] = field_value
+            field_type: str = (
+                RequestFieldType.PLACEHOLDER if field.placeholder else field.field_type
+            )
+            payload.setdefault(field_type, {})[field.key] = field_value
 
         return payload
 
@@ -128,15 +126,11 @@ class RequestSerializer:
         client: Stollen,
         method: StollenMethod[StollenT, StollenClientT],
     ) -> dict[str, Any]:
-        default_field_type: str = (
-            method.default_field_type
-            if method.default_field_type != RequestFieldType.AUTO
-            else RequestFieldType.resolve(http_method=method.http_method)
-        )
+        plan: SerializationPlan = get_serialization_plan(type(method))
 
         # For non-dictionary models
-        if isinstance(method, RootModel):
-            return {default_field_type: method.model_dump()}
+        if plan.is_root:
+            return {plan.default_field_type: method.model_dump()}
 
         payload: dict[str, dict[str, Any]] = {
             RequestFieldType.PLACEHOLDER: {},
@@ -161,7 +155,7 @@ class RequestSerializer:
         return self._prepare_method_fields(
             client=client,
             method=method,
-            default_field_type=default_field_type,
+            plan=plan,
             payload=payload,
         )
 
@@ -170,37 +164,40 @@ class RequestSerializer:
         client: Stollen,
         method: StollenMethod[StollenT, StollenClientT],
     ) -> StollenRequest:
+        plan: SerializationPlan = get_serialization_plan(type(method))
         payload: dict[str, Any] = self.prepare_payload(client=client, method=method)
 
-        raw_url: str = client.base_url
-        if "{subdomain}" in raw_url:
-            subdomain: Optional[str] = client.stollen_get_subdomain(method=method)
+        subdomain: Optional[str] = client.stollen_get_subdomain(method=method)
+        url_subdomain: Optional[str] = None
+        if "subdomain" in compile_url(client.base_url).placeholders:
             if subdomain is None:
                 raise ValueError("Request subdomain is missing!")
-            raw_url = raw_url.format(subdomain=subdomain)
+            url_subdomain = subdomain
 
-        url: str = self.format_url(
-            url=f"{raw_url}/{method.api_method.removeprefix('/')}",
-            payload=payload,
+        template: URLTemplate = compile_method_url(
+            base_url=client.base_url,
+            api_method=method.api_method,
+            subdomain=url_subdomain,
         )
-
-        try:
-            stream_content: bool = issubclass(method.returning, FileResponse)
-            stream_chunk_size: Optional[int] = (
-                getattr(method, "chunk_size", DEFAULT_CHUNK_SIZE) if stream_content else None
-            )
-        except TypeError:
-            stream_content = False
-            stream_chunk_size = None
+        url: str = template.render(template.pop_values(payload))
+        query: dict[str, Any] = payload.pop(RequestFieldType.QUERY, {})
+        for key, value in query.items():
+            # Query strings can't represent booleans, so they are sent as integers
+            if isinstance(value, bool):
+                query[key] = int(value)
 
         return StollenRequest(
             url=url,
             http_method=method.http_method,
             response_data_key=method.response_data_key,
             headers=payload.pop(RequestFieldType.HEADER, {}),
-            query=payload.pop(RequestFieldType.QUERY, {}),
+            query=query,
             body=payload.pop(RequestFieldType.BODY, {}),
             files=payload.pop(RequestFieldType.FILE, {}),
-            stream_content=stream_content,
-            stream_chunk_size=stream_chunk_size,
+            stream_content=plan.stream_content,
+            stream_chunk_size=plan.stream_chunk_size,
+            stream_mode=plan.stream_mode,
+            stream_spool_max_size=plan.stream_spool_max_size,
+            method_type=type(method),
+            subdomain=subdomain,
         )
@@ -1,68 +1,273 @@
+from __future__ import annotations
+
 import asyncio
 from io import BytesIO
-from typing import Any, Optional, Union
+from tempfile import SpooledTemporaryFile
+from types import TracebackType
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Protocol,
+    Union,
+)
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from typing_extensions import Self
 
+from ..enums import StreamMode
+from ..session.timing import RequestTimings
+from ..utils.headers import HeadersView
 from .input_file import InputFile
 
 
-class StollenRequest(BaseModel):
+class ContentReader(Protocol):
+    async def read(self, n: int = -1) -> bytes: ...
+
+    def iter_chunked(self, n: int) -> AsyncIterator[bytes]: ...
+
+
+class _Envelope:
+    """
+    Plain slotted container, since envelopes are created for every call
+    from data, that stollen has built itself, so there is nothing to validate.
+    ``model_copy`` and ``model_dump`` mirror the pydantic API.
+    """
+
+    __slots__: tuple[str, ...] = ()
+    # Fields included into dumps, the rest of slots are internal
+    __dumped__: ClassVar[tuple[str, ...]] = ()
+
+    def model_copy(self, update: Optional[Mapping[str, Any]] = None) -> Self:
+        copy: Self = object.__new__(type(self))
+        for name in type(self).__slots__:
+            object.__setattr__(copy, name, getattr(self, name))
+        for name, value in (update or {}).items():
+            setattr(copy, name, value)
+        return copy
+
+    def model_dump(self) -> dict[str, Any]:
+        dump: dict[str, Any] = {name: getattr(self, name) for name in self.__dumped__}
+        if isinstance(dump.get("headers"), HeadersView):
+            dump["headers"] = dict(dump["headers"])
+        return dump
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in type(self).__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields: str = ", ".join(f"{name}={value!r}" for name, value in self.model_dump().items())
+        return f"{type(self).__name__}({fields})"
+
+
+class StollenRequest(_Envelope):
+    __slots__ = (
+        "url",
+        "http_method",
+        "response_data_key",
+        "headers",
+        "query",
+        "body",
+        "files",
+        "stream_content",
+        "stream_chunk_size",
+        "stream_mode",
+        "stream_spool_max_size",
+        "method_type",
+        "subdomain",
+        "timings",
+    )
+    __dumped__ = __slots__[:-3]
+
     url: str
     http_method: str
-    response_data_key: list[str] = Field(default_factory=list)
-    headers: dict[str, Any] = Field(default_factory=dict)
-    query: dict[str, Union[str, int, float]] = Field(default_factory=dict)
-    body: Optional[Any] = None
-    files: Optional[dict[str, InputFile]] = None
-    stream_content: bool = False
-    stream_chunk_size: Optional[int] = None
+    response_data_key: list[str]
+    headers: dict[str, Any]
+    query: dict[str, Union[str, int, float]]
+    body: Optional[Any]
+    files: Optional[dict[str, InputFile]]
+    stream_content: bool
+    stream_chunk_size: Optional[int]
+    stream_mode: str
+    stream_spool_max_size: Optional[int]
+    # Request origin, used by session-level policies
+    method_type: Optional[type[Any]]
+    subdomain: Optional[str]
+    # Collected only if the session has timing hooks
+    timings: Optional[RequestTimings]
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        http_method: str,
+        response_data_key: Optional[list[str]] = None,
+        headers: Optional[dict[str, Any]] = None,
+        query: Optional[dict[str, Union[str, int, float]]] = None,
+        body: Optional[Any] = None,
+        files: Optional[dict[str, InputFile]] = None,
+        stream_content: bool = False,
+        stream_chunk_size: Optional[int] = None,
+        stream_mode: str = StreamMode.MEMORY,
+        stream_spool_max_size: Optional[int] = None,
+        method_type: Optional[type[Any]] = None,
+        subdomain: Optional[str] = None,
+        timings: Optional[RequestTimings] = None,
+    ) -> None:
+        self.url = url
+        # Enums are stored as plain strings, so that they are rendered as values in logs
+        self.http_method = str.__str__(http_method)
+        self.response_data_key = response_data_key if response_data_key is not None else []
+        self.headers = headers if headers is not None else {}
+        self.query = query if query is not None else {}
+        self.body = body
+        self.files = files
+        self.stream_content = stream_content
+        self.stream_chunk_size = stream_chunk_size
+        self.stream_mode = str.__str__(stream_mode)
+        self.stream_spool_max_size = stream_spool_max_size
+        self.method_type = method_type
+        self.subdomain = subdomain
+        self.timings = timings
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
 
+class StollenResponse(_Envelope):
+    __slots__ = ("status_code", "headers", "body", "size")
+    __dumped__ = __slots__
 
-class StollenResponse(BaseModel):
     status_code: int
-    headers: dict[str, Any] = Field(default_factory=dict)
-    body: Optional[Any] = None
+    headers: MutableMapping[str, Any]
+    body: Optional[Any]
+    # Size of the raw body in bytes, when it's known
+    size: Optional[int]
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        headers: Optional[Mapping[str, Any]] = None,
+        body: Optional[Any] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        self.status_code = status_code
+        # Headers of the transport are not copied, unless they're modified
+        self.headers = HeadersView(headers) if headers is not None else {}
+        self.body = body
+        self.size = size
 
 
 class FileResponse(BaseModel):
-    file: BytesIO
+    file: Optional[Union[BytesIO, SpooledTemporaryFile[bytes]]] = None
     size: Optional[int] = None
     content_type: Optional[str] = None
 
+    _content: Optional[ContentReader] = PrivateAttr(default=None)
+    _release: Optional[Callable[[], Any]] = PrivateAttr(default=None)
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    @classmethod
+    def from_stream(
+        cls,
+        content: ContentReader,
+        release: Callable[[], Any],
+        size: Optional[int] = None,
+        content_type: Optional[str] = None,
+    ) -> FileResponse:
+        """
+        Create a response backed by the live connection.
+
+        :param content: Response content reader.
+        :param release: Callback releasing the connection.
+        :param size: Content length, if known.
+        :param content_type: Content type.
+        """
+        response: FileResponse = cls(size=size, content_type=content_type)
+        response._content = content
+        response._release = release
+        return response
+
+    @property
+    def is_live(self) -> bool:
+        return self._content is not None
+
     @property
     def _in_memory(self) -> bool:
         rolled_to_disk: bool = getattr(self.file, "_rolled", True)
         return not rolled_to_disk
 
+    def _ensure_file(self) -> Union[BytesIO, SpooledTemporaryFile[bytes]]:
+        if self.file is None:
+            raise RuntimeError("This response is streamed from the connection and has no file.")
+        return self.file
+
     async def write(self, data: bytes) -> None:
+        file: Union[BytesIO, SpooledTemporaryFile[bytes]] = self._ensure_file()
         if self.size is not None:
             self.size += len(data)
 
         if self._in_memory:
-            self.file.write(data)
+            file.write(data)
         else:
-            await asyncio.to_thread(self.file.write, data)
+            await asyncio.to_thread(file.write, data)
 
     async def read(self, size: int = -1) -> bytes:
+        if self._content is not None:
+            return await self._content.read(size)
+        file: Union[BytesIO, SpooledTemporaryFile[bytes]] = self._ensure_file()
         if self._in_memory:
-            return self.file.read(size)
-        return await asyncio.to_thread(self.file.read, size)
+            return file.read(size)
+        return await asyncio.to_thread(file.read, size)
+
+    async def iter_chunked(self, chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Iterate over the content, live responses release the connection
+        once the content is exhausted or the iteration is stopped.
+        """
+        if self._content is None:
+            while chunk := await self.read(chunk_size):
+                yield chunk
+            return
+        try:
+            async for chunk in self._content.iter_chunked(chunk_size):
+                yield chunk
+        finally:
+            await self.close()
 
     async def seek(self, offset: int, whence: int = 0) -> None:
+        file: Union[BytesIO, SpooledTemporaryFile[bytes]] = self._ensure_file()
         if self._in_memory:
-            self.file.seek(offset, whence)
+            file.seek(offset, whence)
         else:
-            await asyncio.to_thread(self.file.seek, offset, whence)
+            await asyncio.to_thread(file.seek, offset, whence)
 
     async def close(self) -> None:
+        if self._release is not None:
+            self._release()
+            self._content = None
+            self._release = None
+        if self.file is None:
+            return
         if self._in_memory:
             self.file.close()
         else:
             await asyncio.to_thread(self.file.close)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
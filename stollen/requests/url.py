@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Mapping, Optional
+
+URL_TEMPLATE_CACHE_SIZE = 1024
+
+
+class URLTemplate:
+    """
+    URL with ``{placeholder}`` fields, parsed once and rendered with a single join.
+    """
+
+    __slots__ = ("template", "placeholders", "_parts", "_literal")
+
+    template: str
+    placeholders: frozenset[str]
+    _parts: tuple[tuple[str, Optional[str], Optional[str], str], ...]
+    # Rendered template without placeholders, escaped braces are already unescaped
+    _literal: str
+
+    def __init__(self, template: str) -> None:
+        parts: list[tuple[str, Optional[str], Optional[str], str]] = []
+        for literal, name, format_spec, conversion in Formatter().parse(template):
+            if name == "":
+                raise ValueError(f"Positional placeholders are not supported: {template!r}")
+            parts.append((literal, name, conversion, format_spec or ""))
+        self.template = template
+        self.placeholders = frozenset(name for _, name, _, _ in parts if name is not None)
+        self._parts = tuple(parts)
+        self._literal = "".join(literal for literal, _, _, _ in parts)
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        if not self.placeholders:
+            return self._literal
+
+        chunks: list[str] = []
+        for literal, name, conversion, format_spec in self._parts:
+            chunks.append(literal)
+            if name is None:
+                continue
+            try:
+                value: Any = values[name]
+            except KeyError:
+                raise ValueError(
+                    f"Missing value for the `{name}` placeholder in {self.template!r}!"
+                ) from None
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            elif conversion == "s":
+                value = str(value)
+            chunks.append(format(value, format_spec))
+        return "".join(chunks)
+
+    def pop_values(self, payload: Mapping[str, dict[str, Any]]) -> dict[str, Any]:
+        """
+        Take placeholder values out of the payload buckets,
+        so they are not sent anywhere else.
+        """
+        values: dict[str, Any] = {}
+        for name in self.placeholders:
+            for data in payload.values():
+                if isinstance(data, dict) and name in data:
+                    values[name] = data.pop(name)
+        return values
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.template!r})"
+
+
+@lru_cache(maxsize=URL_TEMPLATE_CACHE_SIZE)
+def compile_url(url: str) -> URLTemplate:
+    return URLTemplate(url)
+
+
+@lru_cache(maxsize=URL_TEMPLATE_CACHE_SIZE)
+def compile_method_url(base_url: str, api_method: str, subdomain: Optional[str]) -> URLTemplate:
+    if subdomain is not None:
+        base_url = base_url.replace("{subdomain}", subdomain)
+    return URLTemplate(f"{base_url}/{api_method.removeprefix('/')}")
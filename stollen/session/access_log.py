@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import logging
+import random
+from dataclasses import dataclass, field
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Any, Optional
+
+from .. import loggers
+
+
+@dataclass(frozen=True)
+class LogSampling:
+    """
+    Sampling of request logs: errors and slow requests are always logged,
+    while only a share of the rest is.
+
+    .. code-block:: python
+
+        Stollen(..., log_sampling=LogSampling(rate=0.01, slow_threshold=1.0))
+
+    :param rate: Share of successful requests to log.
+    :param error_rate: Share of failed requests (status code 400 and above) to log.
+    :param status_rates: Shares by status class overriding the ones above,
+        e.g. ``{3: 0.0, 4: 0.1}`` for redirects and client errors.
+    :param slow_threshold: Duration in seconds, starting from which requests
+        are always logged with a warning.
+    :param log_pending: Whether to log requests before they are sent,
+        pending requests can't be sampled by their outcome.
+    """
+
+    rate: float = 1.0
+    error_rate: float = 1.0
+    status_rates: dict[int, float] = field(default_factory=dict)
+    slow_threshold: Optional[float] = None
+    log_pending: bool = False
+
+    def is_slow(self, duration: float) -> bool:
+        return self.slow_threshold is not None and duration >= self.slow_threshold
+
+    def should_log(self, status_code: int, duration: float) -> bool:
+        if self.is_slow(duration):
+            return True
+        rate: Optional[float] = self.status_rates.get(status_code // 100)
+        if rate is None:
+            rate = self.error_rate if status_code >= 400 else self.rate
+        return rate >= 1 or (rate > 0 and random.random() < rate)  # noqa: S311
+
+
+class _DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> Any:
+        # Messages are formatted by the listener thread instead of the event loop
+        return record
+
+
+def setup_queue_logging(
+    logger: logging.Logger = loggers.client,
+    handlers: Optional[list[logging.Handler]] = None,
+) -> QueueListener:
+    """
+    Move handlers of the logger behind a queue, so that formatting and I/O
+    of log records happen in the listener thread instead of the event loop.
+
+    :param logger: Logger to set up, stollen client logger by default.
+    :param handlers: Handlers to use. By default, handlers of the logger are moved,
+        or, if it has none, handlers of the root logger are used instead of propagation.
+    :return: Started listener, stop it on shutdown to flush the queue.
+    """
+    if handlers is None:
+        handlers = list(logger.handlers)
+        if not handlers:
+            handlers = list(logging.getLogger().handlers)
+            logger.propagate = False
+    for handler in handlers:
+        logger.removeHandler(handler)
+    queue: SimpleQueue[Any] = SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(queue))
+    listener: QueueListener = QueueListener(queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
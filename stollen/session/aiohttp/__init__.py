@@ -1,3 +1,4 @@
+from .pool import SharedPool
 from .session import AiohttpSession
 
-__all__ = ["AiohttpSession"]
+__all__ = ["AiohttpSession", "SharedPool"]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from aiohttp import TCPConnector
+
+from .proxy import ProxyType, prepare_connector
+from .tls import default_ssl_context
+
+
+class SharedPool:
+    """
+    Connection pool shared by sessions of many clients,
+    so that they multiplex over the same connections to the same hosts:
+
+    .. code-block:: python
+
+        pool = SharedPool(limit=200, client_limit=10)
+        bots = [Bot(token=token, session=AiohttpSession(pool=pool)) for token in tokens]
+        ...
+        await pool.close()
+
+    Sessions never close the pool, it's closed by its owner.
+    """
+
+    limit: int
+    client_limit: Optional[int]
+    _connector: Optional[TCPConnector]
+    _connector_type: type[TCPConnector]
+    _connector_kwargs: dict[str, Any]
+
+    def __init__(
+        self,
+        limit: int = 100,
+        client_limit: Optional[int] = None,
+        proxy: Optional[ProxyType] = None,
+        **connector_kwargs: Any,
+    ) -> None:
+        """
+        :param limit: The total number of simultaneous connections of all clients.
+        :param client_limit: The number of simultaneous requests of a single client,
+            so that busy clients can't take the whole pool. Not limited by default.
+        :param proxy: The proxy to be used for requests of all clients.
+        :param connector_kwargs: Additional connector kwargs.
+        """
+        if client_limit is not None and client_limit < 1:
+            raise ValueError("Client limit must be a positive integer!")
+        self.limit = limit
+        self.client_limit = client_limit
+        self._connector = None
+        self._connector_type = TCPConnector
+        self._connector_kwargs = {"limit": limit}
+        self._connector_kwargs.update(connector_kwargs)
+        if proxy is not None:
+            try:
+                self._connector_type, proxy_kwargs = prepare_connector(proxy)
+            except ImportError as error:
+                raise RuntimeError(
+                    "In order to use aiohttp client for proxy requests, install "
+                    "https://pypi.org/project/aiohttp-socks/."
+                    "You can do it by running `pip install stollen[proxy]`."
+                ) from error
+            self._connector_kwargs.update(proxy_kwargs)
+
+    @property
+    def closed(self) -> bool:
+        return self._connector is None or self._connector.closed
+
+    def get_connector(self) -> TCPConnector:
+        """
+        Get the connector, it's created on the first call inside the event loop.
+        """
+        if self._connector is None or self._connector.closed:
+            self._connector = self._connector_type(
+                **{"ssl": default_ssl_context(), **self._connector_kwargs},
+            )
+        return self._connector
+
+    async def close(self) -> None:
+        if self._connector is not None and not self._connector.closed:
+            await self._connector.close()
+        self._connector = None
@@ -1,20 +1,50 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+from concurrent.futures import Executor
+from functools import partial
 from io import BytesIO
-from ssl import create_default_context
-from typing import TYPE_CHECKING, Any, Optional, cast
+from tempfile import SpooledTemporaryFile
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Union, cast
 
-import certifi
-from aiohttp import ClientResponse, ClientSession, FormData, TCPConnector
+from aiohttp import (
+    ClientConnectionError,
+    ClientPayloadError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    FormData,
+    TCPConnector,
+)
 
 from ...const import DEFAULT_REQUEST_TIMEOUT
+from ...enums import StreamMode
 from ...requests import FileResponse, InputFile, RequestSerializer, StollenRequest, StollenResponse
+from ...utils.headers import get_header
 from ..base import BaseSession
+from ..cache import ResponseCache
+from ..ratelimit import RateLimiter
+from ..stats import PoolSnapshot, StatsRegistry
+from ..timing import RequestTimings, TimingHook
+from .pool import SharedPool
 from .proxy import ProxyType, prepare_connector
+from .tls import default_ssl_context
+from .tracing import create_trace_config
 
 if TYPE_CHECKING:
     from ...client import StollenClientT
+    from ...types import JsonLoads
+
+
+def decode_json(loads: JsonLoads, content: bytes, encoding: str) -> Any:
+    # Module-level, so that it can be sent to a process pool
+    if not content.strip():
+        return None
+    if codecs.lookup(encoding).name != "utf-8":
+        return loads(content.decode(encoding))
+    return loads(content)
 
 
 class AiohttpSession(BaseSession):
@@ -23,6 +53,10 @@ class AiohttpSession(BaseSession):
     _connector_kwargs: dict[str, Any]
     _should_reset_connector: bool
     _proxy: Optional[ProxyType]
+    _pool: Optional[SharedPool]
+    _slots: Optional[asyncio.Semaphore]
+    _slots_loop: Optional[asyncio.AbstractEventLoop]
+    transient_errors = (ClientConnectionError, ClientPayloadError, asyncio.TimeoutError, OSError)
 
     def __init__(
         self,
@@ -30,6 +64,13 @@ class AiohttpSession(BaseSession):
         timeout: int = DEFAULT_REQUEST_TIMEOUT,
         limit: int = 100,
         proxy: Optional[ProxyType] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        offload_threshold: Optional[int] = None,
+        offload_executor: Optional[Executor] = None,
+        timing_hooks: Optional[Iterable[TimingHook]] = None,
+        stats: Optional[StatsRegistry] = None,
+        pool: Optional[SharedPool] = None,
         **connector_kwargs: Any,
     ) -> None:
         """
@@ -37,18 +78,38 @@ class AiohttpSession(BaseSession):
 
         :param limit: The total number of simultaneous connections. Default is 100.
         :param proxy: The proxy to be used for requests. Default is None.
+        :param cache: Cache for results of methods declared with ``cache_ttl``.
+        :param rate_limiter: Client-side rate limiter, disabled by default.
+        :param offload_threshold: Size of the response body in bytes,
+            starting from which it's decoded and validated outside the event loop.
+        :param offload_executor: Executor for offloaded responses.
+        :param timing_hooks: Callbacks receiving durations of the request phases.
+        :param stats: Registry aggregating timings of the session, disabled by default.
+        :param pool: Connection pool shared with other sessions,
+            ``limit``, ``proxy`` and connector kwargs are taken from it then.
         :param connector_kwargs: Additional connector kwargs.
         """
-        super().__init__(serializer=serializer, timeout=timeout)
+        super().__init__(
+            serializer=serializer,
+            timeout=timeout,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            offload_threshold=offload_threshold,
+            offload_executor=offload_executor,
+            timing_hooks=timing_hooks,
+            stats=stats,
+        )
         self._session = None
         self._connector_type = TCPConnector
-        self._connector_kwargs = {
-            "ssl": create_default_context(cafile=certifi.where()),
-            "limit": limit,
-        }
+        self._connector_kwargs = {"limit": limit}
         self._connector_kwargs.update(connector_kwargs)
         self._should_reset_connector = True
         self._proxy = proxy
+        self._pool = pool
+        self._slots = None
+        self._slots_loop = None
+        if pool is not None and proxy is not None:
+            raise ValueError("Proxy of the shared pool is set on the pool itself!")
         if proxy is not None:
             try:
                 self.setup_proxy(proxy)
@@ -63,27 +124,76 @@ class AiohttpSession(BaseSession):
     def proxy(self) -> Optional[ProxyType]:
         return self._proxy
 
+    @property
+    def pool(self) -> Optional[SharedPool]:
+        return self._pool
+
     def setup_proxy(self, proxy: ProxyType) -> None:
+        if self._pool is not None:
+            raise ValueError("Proxy of the shared pool is set on the pool itself!")
         self._connector_type, self._connector_kwargs = prepare_connector(proxy)
         self._proxy = proxy
         self._should_reset_connector = True
 
+    def add_timing_hook(self, hook: TimingHook) -> None:
+        if not self.instrumented:
+            # Connections are traced only if there are hooks, so the session is recreated
+            self._should_reset_connector = True
+        super().add_timing_hook(hook)
+
+    def add_start_hook(self, hook: TimingHook) -> None:
+        if not self.instrumented:
+            self._should_reset_connector = True
+        super().add_start_hook(hook)
+
+    def get_pool_stats(self) -> Optional[PoolSnapshot]:
+        if self._session is None or self._session.closed:
+            return None
+        connector: Any = self._session.connector
+        # aiohttp doesn't expose the pool state, so the connector internals are inspected
+        acquired_per_host: dict[str, int] = {
+            f"{key.host}:{key.port}": len(connections)
+            for key, connections in getattr(connector, "_acquired_per_host", {}).items()
+            if connections
+        }
+        return PoolSnapshot(
+            limit=connector.limit,
+            limit_per_host=connector.limit_per_host,
+            acquired=len(getattr(connector, "_acquired", ())),
+            idle=sum(len(conns) for conns in getattr(connector, "_conns", {}).values()),
+            waiters=sum(len(waiters) for waiters in getattr(connector, "_waiters", {}).values()),
+            acquired_per_host=acquired_per_host,
+        )
+
     async def get_session(self) -> ClientSession:
         if self._should_reset_connector:
+            # Reset before waiting, so that concurrent callers don't close the new session
+            self._should_reset_connector = False
             await self.close()
 
         if self._session is None or self._session.closed:
+            connector: TCPConnector = (
+                self._pool.get_connector()
+                if self._pool is not None
+                else self._connector_type(
+                    **{"ssl": default_ssl_context(), **self._connector_kwargs}
+                )
+            )
             self._session = ClientSession(
-                connector=self._connector_type(**self._connector_kwargs),
+                connector=connector,
+                connector_owner=self._pool is None,
                 json_serialize=self.serializer.json_dumps,
+                trace_configs=[create_trace_config()] if self.instrumented else None,
             )
-            self._should_reset_connector = False
 
         return self._session
 
     async def close(self) -> None:
         if self._session is not None and not self._session.closed:
             await self._session.close()
+            if self._pool is not None:
+                # Connections belong to the shared pool and stay open
+                return
 
             # Wait 250 ms for the underlying SSL connections to close
             # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
@@ -108,55 +218,178 @@ class AiohttpSession(BaseSession):
 
         return form
 
-    async def make_request(
+    def build_body(
         self,
         client: StollenClientT,
         request: StollenRequest,
-        request_timeout: Optional[int] = None,
-    ) -> tuple[StollenResponse, Any]:
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        headers: dict[str, Any] = request.headers
         body_kwargs: dict[str, Any] = {}
         if isinstance(request.body, (str, bytes)):
             body_kwargs["data"] = request.body
         elif request.files:
             body_kwargs["data"] = self.build_form_data(client=client, request=request)
-        else:
-            body_kwargs["json"] = request.body
+        elif request.body is not None:
+            # Encoded right into bytes, instead of aiohttp encoding the text
+            body_kwargs["data"] = self.serializer.json_backend.dumps(request.body)
+            if get_header(headers, "Content-Type") is None:
+                headers = {**headers, "Content-Type": "application/json"}
+        return headers, body_kwargs
+
+    async def make_request(
+        self,
+        client: StollenClientT,
+        request: StollenRequest,
+        request_timeout: Optional[int] = None,
+    ) -> tuple[StollenResponse, Any]:
+        slots: Optional[asyncio.Semaphore] = self.get_slots()
+        # Live streams hold the connection after the request, so they're limited by the pool only
+        if slots is None or (request.stream_content and request.stream_mode == StreamMode.LIVE):
+            return await self.perform_request(client, request, request_timeout=request_timeout)
+        async with slots:
+            return await self.perform_request(client, request, request_timeout=request_timeout)
+
+    def get_slots(self) -> Optional[asyncio.Semaphore]:
+        """
+        Get the semaphore limiting requests of this client in the shared pool.
+        It's created inside the running loop, since on Python 3.9
+        semaphores are bound to the loop, that exists when they are created.
+        """
+        if self._pool is None or self._pool.client_limit is None:
+            return None
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self._pool.client_limit)
+            self._slots_loop = loop
+        return self._slots
+
+    async def perform_request(
+        self,
+        client: StollenClientT,
+        request: StollenRequest,
+        request_timeout: Optional[int] = None,
+    ) -> tuple[StollenResponse, Any]:
+        headers, body_kwargs = self.build_body(client=client, request=request)
+
+        total_timeout: int = request_timeout or self.timeout
+        timeout: Union[int, ClientTimeout] = total_timeout
+        if request.stream_content and request.stream_mode != StreamMode.MEMORY:
+            # Content may be consumed long after the request, so only idle time is limited
+            timeout = ClientTimeout(sock_connect=total_timeout, sock_read=total_timeout)
 
         session: ClientSession = await self.get_session()
+        timings: Optional[RequestTimings] = request.timings
+        if timings is not None:
+            body_kwargs["trace_request_ctx"] = timings
+            payload: Any = body_kwargs.get("data")
+            if isinstance(payload, (str, bytes)):
+                timings.bytes_sent += len(payload)
+            transport: float = timings.transport
+            sent_at: float = perf_counter()
         response: ClientResponse = await session.request(
             method=request.http_method,
             url=request.url,
-            headers=request.headers,
+            headers=headers,
             params=request.query,
-            timeout=request_timeout or self.timeout,  # type: ignore[arg-type]
+            timeout=timeout,  # type: ignore[arg-type]
             **body_kwargs,
         )
+        if timings is not None:
+            # Everything except the traced phases is waiting for the response
+            timings.ttfb += perf_counter() - sent_at - (timings.transport - transport)
 
-        if not request.stream_content:
-            if response.content_type.startswith("application/json"):
-                body = await response.json(loads=self.serializer.json_loads)
-            else:
-                body = await response.text()
+        body: Any
+        size: Optional[int] = None
+        is_json: bool = response.content_type.startswith("application/json")
+        # Errors of streaming methods are parsed as well, so that their messages are available
+        if not request.stream_content or (response.status >= 400 and is_json):
+            body, size = await self.read_content(response=response, timings=timings)
+        elif request.stream_mode == StreamMode.LIVE and response.status < 400:
+            body = FileResponse.from_stream(
+                content=response.content,
+                release=response.release,
+                size=response.content_length,
+                content_type=response.content_type,
+            )
         else:
+            body = await self.read_file(request=request, response=response)
+
+        raw_response: StollenResponse = StollenResponse(
+            status_code=response.status,
+            headers=response.headers,
+            body=body,
+            size=size,
+        )
+
+        try:
+            data: Any = self.prepare_response(
+                client=client,
+                request=request,
+                response=raw_response,
+            )
+        except BaseException:
+            if isinstance(body, FileResponse) and body.is_live:
+                await body.close()
+            raise
+
+        return raw_response, data
+
+    async def read_content(
+        self,
+        response: ClientResponse,
+        timings: Optional[RequestTimings] = None,
+    ) -> tuple[Any, int]:
+        if timings is not None:
+            read_at: float = perf_counter()
+        content: bytes = await response.read()
+        size: int = len(content)
+        if timings is not None:
+            timings.body += perf_counter() - read_at
+            timings.bytes_received += size
+        if not response.content_type.startswith("application/json"):
+            return await response.text(), size
+
+        decode: Callable[[], Any] = partial(
+            decode_json,
+            self.serializer.json_backend.loads,
+            content,
+            response.get_encoding(),
+        )
+        if timings is not None:
+            decode_at: float = perf_counter()
+        body: Any = (
+            await self.offload(decode, picklable=True) if self.should_offload(size) else decode()
+        )
+        if timings is not None:
+            timings.decode += perf_counter() - decode_at
+        return body, size
+
+    @classmethod
+    async def read_file(cls, request: StollenRequest, response: ClientResponse) -> FileResponse:
+        chunk_size: int = cast(int, request.stream_chunk_size)
+        if request.stream_mode != StreamMode.SPOOLED:
             buffer: BytesIO = BytesIO()
-            async for chunk in response.content.iter_chunked(cast(int, request.stream_chunk_size)):
+            async for chunk in response.content.iter_chunked(chunk_size):
                 # noinspection PyTypeChecker
                 buffer.write(chunk)
             buffer.seek(0)
-            body = FileResponse(
+            return FileResponse(
                 file=buffer,
                 size=response.content_length,
                 content_type=response.content_type,
             )
 
-        raw_response: StollenResponse = StollenResponse(
-            status_code=response.status,
-            headers=dict(response.headers),
-            body=body,
-        )
-
-        return raw_response, self.prepare_response(
-            client=client,
-            request=request,
-            response=raw_response,
+        file: FileResponse = FileResponse(
+            file=SpooledTemporaryFile(max_size=request.stream_spool_max_size or 0),
+            size=0,
+            content_type=response.content_type,
         )
+        try:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                await file.write(chunk)
+            await file.seek(0)
+        except BaseException:
+            response.close()
+            await file.close()
+            raise
+        return file
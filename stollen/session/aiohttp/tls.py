@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from ssl import SSLContext, create_default_context
+
+import certifi
+
+
+@lru_cache(maxsize=1)
+def default_ssl_context() -> SSLContext:
+    """
+    SSL context with certifi CA bundle, built once and shared by all connectors,
+    since loading the bundle takes tens of milliseconds.
+    Pass your own context as ``ssl`` connector kwarg instead of modifying this one.
+    """
+    return create_default_context(cafile=certifi.where())
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from time import perf_counter
+from types import SimpleNamespace
+from typing import Any, Optional
+
+from aiohttp import ClientSession, TraceConfig
+
+from ..timing import RequestTimings
+
+
+def _timings(context: SimpleNamespace) -> Optional[RequestTimings]:
+    timings: Any = context.trace_request_ctx
+    return timings if isinstance(timings, RequestTimings) else None
+
+
+def _mark(name: str) -> Any:
+    async def mark(session: ClientSession, context: SimpleNamespace, params: Any) -> None:
+        setattr(context, name, perf_counter())
+
+    return mark
+
+
+async def _on_queued_end(session: ClientSession, context: SimpleNamespace, params: Any) -> None:
+    timings: Optional[RequestTimings] = _timings(context)
+    if timings is not None:
+        timings.queue += perf_counter() - context.queued_at
+
+
+async def _on_dns_end(session: ClientSession, context: SimpleNamespace, params: Any) -> None:
+    timings: Optional[RequestTimings] = _timings(context)
+    if timings is not None:
+        context.dns = perf_counter() - context.resolving_at
+        timings.dns += context.dns
+
+
+async def _on_connection_end(
+    session: ClientSession,
+    context: SimpleNamespace,
+    params: Any,
+) -> None:
+    timings: Optional[RequestTimings] = _timings(context)
+    if timings is not None:
+        # Hosts are resolved while the connection is being created
+        dns: float = getattr(context, "dns", 0.0)
+        timings.connect += perf_counter() - context.connecting_at - dns
+
+
+def create_trace_config() -> TraceConfig:
+    """
+    Trace config recording connection pool waiting, DNS resolution and connecting
+    into the timings passed as ``trace_request_ctx``.
+    """
+    trace_config: TraceConfig = TraceConfig()
+    trace_config.on_connection_queued_start.append(_mark("queued_at"))
+    trace_config.on_connection_queued_end.append(_on_queued_end)
+    trace_config.on_connection_create_start.append(_mark("connecting_at"))
+    trace_config.on_connection_create_end.append(_on_connection_end)
+    trace_config.on_dns_resolvehost_start.append(_mark("resolving_at"))
+    trace_config.on_dns_resolvehost_end.append(_on_dns_end)
+    return trace_config
@@ -1,26 +1,55 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from time import perf_counter
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Hashable,
+    Iterable,
+    Optional,
+    TypeVar,
+)
 
 from pydantic import TypeAdapter, ValidationError
 from typing_extensions import Self
 
 from .. import loggers
-from ..const import DEFAULT_REQUEST_TIMEOUT
+from ..const import DEFAULT_CHUNK_SIZE, DEFAULT_REQUEST_TIMEOUT
+from ..enums import HTTPMethod, StreamMode
 from ..exceptions import DetailedStollenAPIError, StollenAPIError, StollenError
 from ..requests.serializer import RequestSerializer
 from ..requests.types import StollenRequest, StollenResponse
+from ..utils.binding import bind_client
+from ..utils.construct import ConstructError, construct
+from ..utils.flight import SingleFlight
+from ..utils.interning import InternPool
+from ..utils.json_stream import JsonArrayParser
 from ..utils.mapping import recursive_getitem
+from .access_log import LogSampling
+from .cache import ResponseCache, make_request_key
+from .items import get_item_validator
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .stats import PoolSnapshot, StatsRegistry, StatsSnapshot
+from .timing import RequestTimings, TimingHook, emit_timings, start_timings
 
 if TYPE_CHECKING:
     from ..client import Stollen, StollenClientT
     from ..method import StollenMethod
     from ..types import JsonDumps, JsonLoads, StollenT
 
+T = TypeVar("T")
+
 
 def pre_log_request(request: StollenRequest) -> None:
     loggers.client.info(
@@ -35,21 +64,29 @@ def log_request(
     response: StollenResponse,
     loop: AbstractEventLoop,
     start_time: float,
+    sampling: Optional[LogSampling] = None,
 ) -> None:
-    args: tuple[Any, ...] = (
+    duration: float = loop.time() - start_time
+    level: int = logging.INFO
+    if response.status_code >= 400:
+        level = logging.ERROR
+    elif sampling is not None and sampling.is_slow(duration):
+        level = logging.WARNING
+    if not loggers.client.isEnabledFor(level):
+        return
+    if sampling is not None and not sampling.should_log(response.status_code, duration):
+        return
+
+    loggers.client.log(
+        level,
         "HTTP Request: %s %s (ok=%s, status_code=%d, duration=%dms)",
         request.http_method,
         request.url,
         response.status_code < 400,
         response.status_code,
-        (loop.time() - start_time) * 1000,
+        duration * 1000,
     )
 
-    if response.status_code < 400:
-        loggers.client.info(*args)
-    else:
-        loggers.client.error(*args)
-
 
 class BaseSession(ABC):
     """
@@ -62,18 +99,92 @@ class BaseSession(ABC):
     exclude_defaults: bool
     serializer: RequestSerializer
     timeout: int
+    cache: ResponseCache
+    rate_limiter: Optional[RateLimiter]
+    offload_threshold: Optional[int]
+    offload_executor: Optional[Executor]
+    timing_hooks: list[TimingHook]
+    start_hooks: list[TimingHook]
+    stats: Optional[StatsRegistry]
+    # Transport errors, that are worth retrying
+    transient_errors: tuple[type[BaseException], ...] = (OSError, asyncio.TimeoutError)
+    _flight: SingleFlight[tuple[StollenResponse, Any]]
 
     def __init__(
         self,
         *,
         serializer: RequestSerializer = RequestSerializer(),
         timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        offload_threshold: Optional[int] = None,
+        offload_executor: Optional[Executor] = None,
+        timing_hooks: Optional[Iterable[TimingHook]] = None,
+        stats: Optional[StatsRegistry] = None,
     ) -> None:
+        """
+        :param serializer: Request serializer.
+        :param timeout: Default request timeout.
+        :param cache: Cache for results of methods declared with ``cache_ttl``.
+            By default, a new in-memory cache is created for every session.
+        :param rate_limiter: Client-side rate limiter, disabled by default.
+        :param offload_threshold: Size of the response body in bytes,
+            starting from which it's decoded and validated outside the event loop.
+            Disabled by default.
+        :param offload_executor: Executor for offloaded responses.
+            By default, the default executor of the event loop is used.
+            With a process pool only decoding is done there (so ``json_loads`` must be picklable),
+            while models are validated in a thread of the default executor.
+        :param timing_hooks: Callbacks receiving durations of the request phases
+            after every request. Nothing is measured without them.
+        :param stats: Registry aggregating timings of the session, disabled by default.
+        """
         self.json_loads = serializer.json_loads
         self.json_dumps = serializer.json_dumps
         self.exclude_defaults = serializer.exclude_defaults
         self.serializer = serializer
         self.timeout = timeout
+        self.cache = cache if cache is not None else ResponseCache()
+        self.rate_limiter = rate_limiter
+        self.offload_threshold = offload_threshold
+        self.offload_executor = offload_executor
+        self.timing_hooks = list(timing_hooks or ())
+        self.start_hooks = []
+        self.stats = stats
+        if stats is not None:
+            stats.attach(self)
+        self._flight = SingleFlight()
+
+    @property
+    def instrumented(self) -> bool:
+        return bool(self.timing_hooks or self.start_hooks)
+
+    def add_timing_hook(self, hook: TimingHook) -> None:
+        self.timing_hooks.append(hook)
+
+    def add_start_hook(self, hook: TimingHook) -> None:
+        """
+        Register a callback called before the request is sent,
+        it receives the same timings as the timing hooks.
+        """
+        self.start_hooks.append(hook)
+
+    def get_pool_stats(self) -> Optional[PoolSnapshot]:
+        return None
+
+    def get_stats(self) -> StatsSnapshot:
+        if self.stats is None:
+            raise RuntimeError("Statistics are not collected, pass `stats` to the session!")
+        return self.stats.snapshot(pool=self.get_pool_stats())
+
+    def serialize(self, client: Stollen, method: StollenMethod[Any, Any]) -> StollenRequest:
+        if not self.instrumented:
+            return self.serializer.to_request(client=client, method=method)
+        timings: RequestTimings = start_timings()
+        request: StollenRequest = self.serializer.to_request(client=client, method=method)
+        timings.serialize = perf_counter() - timings.started_at
+        timings.bind(request)
+        return request
 
     @abstractmethod
     async def close(self) -> None:
@@ -141,17 +252,76 @@ class BaseSession(ABC):
                 stringify=client.stringify_detailed_errors,
             )
 
+    def should_offload(self, size: Optional[int]) -> bool:
+        return (
+            self.offload_threshold is not None
+            and size is not None
+            and size >= self.offload_threshold
+        )
+
+    async def offload(self, func: Callable[[], T], *, picklable: bool = False) -> T:
+        """
+        Run the function in the offload executor.
+        Functions, that can't be pickled, never go to a process pool.
+        """
+        executor: Optional[Executor] = self.offload_executor
+        if not picklable and isinstance(executor, ProcessPoolExecutor):
+            executor = None
+        return await asyncio.get_running_loop().run_in_executor(executor, func)
+
+    @classmethod
+    def is_trusted(cls, client: Stollen, method: StollenMethod[Any, Any]) -> bool:
+        return method.trusted if method.trusted is not None else client.trust_responses
+
+    def get_retry_policy(self, client: Stollen, request: StollenRequest) -> Optional[RetryPolicy]:
+        policy: Optional[RetryPolicy] = getattr(request.method_type, "retry_policy", None)
+        return policy if policy is not None else client.retry_policy
+
     async def raw_request(
         self,
         client: Stollen,
         request: StollenRequest,
         request_timeout: Optional[int] = None,
     ) -> tuple[StollenResponse, Any]:
+        attempt: Callable[[], Awaitable[tuple[StollenResponse, Any]]] = partial(
+            self.send_request,
+            client=client,
+            request=request,
+            request_timeout=request_timeout,
+        )
+        policy: Optional[RetryPolicy] = self.get_retry_policy(client=client, request=request)
+        if policy is None:
+            return await attempt()
+        return await policy.execute(
+            request=request,
+            attempt=attempt,
+            transient_errors=self.transient_errors,
+        )
+
+    async def send_request(
+        self,
+        client: Stollen,
+        request: StollenRequest,
+        request_timeout: Optional[int] = None,
+    ) -> tuple[StollenResponse, Any]:
+        timings: Optional[RequestTimings] = request.timings
+        if timings is not None:
+            timings.attempts += 1
+        if self.rate_limiter is not None:
+            if timings is None:
+                await self.rate_limiter.acquire(request)
+            else:
+                throttle_start: float = perf_counter()
+                await self.rate_limiter.acquire(request)
+                timings.throttle += perf_counter() - throttle_start
+
         loop: AbstractEventLoop = asyncio.get_running_loop()
         start_time: float = loop.time()
 
         try:
-            if client.echo_requests:
+            if client.echo_requests and (
+                client.log_sampling is None or client.log_sampling.log_pending
+            ):
                 pre_log_request(request=request)
             response, data = await self.make_request(
                 client=client,
@@ -159,43 +329,202 @@ class BaseSession(ABC):
                 request_timeout=request_timeout,
             )
         except StollenAPIError as error:
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(request=request, response=error.response)
             if client.echo_requests:
                 log_request(
                     request=request,
                     response=error.response,
                     loop=loop,
                     start_time=start_time,
+                    sampling=client.log_sampling,
                 )
             raise
 
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(request=request, response=response)
         if client.echo_requests:
-            log_request(request=request, response=response, loop=loop, start_time=start_time)
+            log_request(
+                request=request,
+                response=response,
+                loop=loop,
+                start_time=start_time,
+                sampling=client.log_sampling,
+            )
 
         return response, data
 
-    async def __call__(
+    @classmethod
+    def validate_response(
+        cls,
+        client: Stollen,
+        method: StollenMethod[StollenT, StollenClientT],
+        data: Any,
+    ) -> StollenT:
+        result: StollenT
+        if cls.is_trusted(client=client, method=method):
+            result = construct(method.returning, data, client)
+        else:
+            adapter: TypeAdapter[StollenT] = method.type_adapter
+            result = adapter.validate_python(data, context={"client": client})
+        bind_client(method.returning, result, client)
+        if client.intern_objects is not False:
+            pool: InternPool = (
+                client.intern_objects
+                if isinstance(client.intern_objects, InternPool)
+                else InternPool(maxsize=None)
+            )
+            # The result itself is never shared, since it's bound to the caller
+            pool.intern_nested(result)
+        return result
+
+    async def execute(
         self,
         client: Stollen,
         method: StollenMethod[StollenT, StollenClientT],
+        request: StollenRequest,
         request_timeout: Optional[int] = None,
+    ) -> tuple[StollenResponse, StollenT]:
+        timings: Optional[RequestTimings] = request.timings
+        if timings is not None:
+            emit_timings(self.start_hooks, timings)
+        try:
+            response, data = await self.raw_request(
+                client=client,
+                request=request,
+                request_timeout=request_timeout,
+            )
+            if timings is None:
+                return response, await self.validate(client, method, request, response, data)
+            timings.status_code = response.status_code
+            validate_start: float = perf_counter()
+            result: StollenT = await self.validate(client, method, request, response, data)
+            timings.validate = perf_counter() - validate_start
+            return response, result
+        except BaseException as error:
+            if timings is not None:
+                timings.error = error
+                if isinstance(error, StollenAPIError):
+                    timings.status_code = error.response.status_code
+            raise
+        finally:
+            if timings is not None:
+                timings.finish()
+                emit_timings(self.timing_hooks, timings)
+
+    async def validate(
+        self,
+        client: Stollen,
+        method: StollenMethod[StollenT, StollenClientT],
+        request: StollenRequest,
+        response: StollenResponse,
+        data: Any,
     ) -> StollenT:
+        validate: Callable[[], StollenT] = partial(
+            self.validate_response,
+            client=client,
+            method=method,
+            data=data,
+        )
+        try:
+            if self.should_offload(response.size):
+                return await self.offload(validate)
+            return validate()
+        except (ValidationError, ConstructError) as error:
+            raise DetailedStollenAPIError(
+                message="An error has occurred while validating the response.",
+                request=request,
+                response=response,
+                stringify=client.stringify_detailed_errors,
+            ) from error
+
+    async def stream_items(
+        self,
+        client: Stollen,
+        method: StollenMethod[Any, StollenClientT],
+        request_timeout: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Parse the array returned by the method incrementally and yield validated items,
+        so that neither the whole content nor all the items are held in memory.
+        """
+        validate: Callable[[Any], Any] = get_item_validator(
+            method_type=type(method),
+            client=client,
+            trusted=self.is_trusted(client=client, method=method),
+        )
         request: StollenRequest = self.serializer.to_request(client=client, method=method)
-        response, data = await self.raw_request(
+        request = request.model_copy(
+            update={
+                "stream_content": True,
+                "stream_mode": StreamMode.LIVE,
+                "stream_chunk_size": request.stream_chunk_size or DEFAULT_CHUNK_SIZE,
+            },
+        )
+        response, file = await self.raw_request(
             client=client,
             request=request,
             request_timeout=request_timeout,
         )
-
-        adapter: TypeAdapter[StollenT] = method.type_adapter
+        parser: JsonArrayParser = JsonArrayParser(
+            path=[*client.response_data_key, *request.response_data_key],
+        )
         try:
-            return adapter.validate_python(data, context={"client": client})
-        except ValidationError as error:
+            async for chunk in file.iter_chunked(request.stream_chunk_size):
+                for item in parser.feed(chunk):
+                    yield validate(item)
+                if parser.done:
+                    break
+            for item in parser.close():
+                yield validate(item)
+        except (KeyError, ValueError) as error:
+            message: str = (
+                "An error has occurred while validating the response."
+                if isinstance(error, (ValidationError, ConstructError))
+                else "An error has occurred and stollen can't parse the response."
+            )
             raise DetailedStollenAPIError(
-                message="An error has occurred while validating the response.",
+                message=message,
                 request=request,
                 response=response,
                 stringify=client.stringify_detailed_errors,
             ) from error
+        finally:
+            await file.close()
+
+    async def __call__(
+        self,
+        client: Stollen,
+        method: StollenMethod[StollenT, StollenClientT],
+        request_timeout: Optional[int] = None,
+    ) -> StollenT:
+        request: StollenRequest = self.serialize(client=client, method=method)
+        execute: Callable[[], Awaitable[tuple[StollenResponse, StollenT]]] = partial(
+            self.execute,
+            client=client,
+            method=method,
+            request=request,
+            request_timeout=request_timeout,
+        )
+
+        key: Optional[Hashable] = None
+        if method.cache_ttl or client.coalesce_requests:
+            key = make_request_key(client=client, request=request)
+
+        if key is not None and method.cache_ttl:
+            cached: StollenT = await self.cache.fetch(
+                key=key,
+                ttl=method.cache_ttl,
+                factory=execute,
+            )
+            return cached
+
+        result: StollenT
+        if key is not None and HTTPMethod.is_idempotent(request.http_method):
+            _, result = await self._flight.do(key, execute)
+        else:
+            _, result = await execute()
+        return result
 
     async def __aenter__(self) -> Self:
         return self
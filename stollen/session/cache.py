@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Hashable, Optional
+
+from ..utils.flight import SingleFlight
+
+if TYPE_CHECKING:
+    from ..client import Stollen
+    from ..requests import StollenRequest, StollenResponse
+
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass()
+class CacheEntry:
+    value: Any
+    expires_at: float
+    size: int
+
+
+def approximate_size(response: StollenResponse) -> int:
+    if response.size is not None:
+        return response.size
+    for header in ("Content-Length", "content-length"):
+        if header in response.headers:
+            try:
+                return int(response.headers[header])
+            except ValueError:
+                break
+    if isinstance(response.body, (str, bytes)):
+        return len(response.body)
+    return len(json.dumps(response.body, default=str))
+
+
+def make_request_key(client: Stollen, request: StollenRequest) -> Optional[Hashable]:
+    """
+    Build a key identifying the serialized request and the way its response is decoded,
+    so that methods sharing the endpoint (e.g. with different ``returning``) never share results.
+    Returns None for requests, that can't be shared between callers.
+    """
+    if request.files or request.stream_content:
+        return None
+    return (
+        id(client),
+        request.method_type,
+        tuple(request.response_data_key),
+        request.http_method,
+        request.url,
+        json.dumps(
+            [request.query, request.headers, request.body],
+            sort_keys=True,
+            default=str,
+        ),
+    )
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of validated method results.
+
+    Used by the session for methods declared with ``cache_ttl``.
+    Entries are evicted by count and by approximate response size,
+    concurrent misses for the same request wait for a single upstream call.
+    Cached results are shared between callers, so they should not be mutated.
+    """
+
+    max_entries: int
+    max_bytes: int
+    _entries: OrderedDict[Hashable, CacheEntry]
+    _size: int
+    _flight: SingleFlight[Any]
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._flight = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        entry: Optional[CacheEntry] = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Hashable, value: Any, ttl: float, size: int) -> None:
+        self.delete(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = CacheEntry(value=value, expires_at=time.monotonic() + ttl, size=size)
+        self._size += size
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+
+    def delete(self, key: Hashable) -> None:
+        entry: Optional[CacheEntry] = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+    async def fetch(
+        self,
+        key: Hashable,
+        ttl: float,
+        factory: Callable[[], Awaitable[tuple[StollenResponse, Any]]],
+    ) -> Any:
+        entry: Optional[CacheEntry] = self.get(key)
+        if entry is not None:
+            return entry.value
+
+        async def fill() -> Any:
+            response, value = await factory()
+            self.set(key=key, value=value, ttl=ttl, size=approximate_size(response))
+            return value
+
+        return await self._flight.do(key, fill)
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional, Union
+
+from ..const import DEFAULT_CHUNK_SIZE
+from ..enums import StreamMode
+from ..requests.types import FileResponse, StollenRequest, StollenResponse
+from ..utils.headers import get_header
+
+if TYPE_CHECKING:
+    from ..client import Stollen
+    from ..method import StollenStreamingMethod
+
+DEFAULT_SEGMENT_ATTEMPTS = 3
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)")
+
+
+@dataclass()
+class Segment:
+    start: int
+    end: int
+    position: int
+
+    @property
+    def completed(self) -> bool:
+        return self.position > self.end
+
+
+def parse_content_range(response: StollenResponse) -> Optional[tuple[int, int, Optional[int]]]:
+    value: Optional[str] = get_header(response.headers, "Content-Range")
+    if response.status_code != 206 or value is None:
+        return None
+    match: Optional[re.Match[str]] = _CONTENT_RANGE.fullmatch(value.strip())
+    if match is None:
+        return None
+    start, end, total = match.groups()
+    return int(start), int(end), None if total == "*" else int(total)
+
+
+def _preallocate(path: Path, size: int) -> None:
+    with open(path, "wb") as file:
+        if hasattr(os, "posix_fallocate") and size:
+            os.posix_fallocate(file.fileno(), 0, size)
+        else:
+            file.truncate(size)
+
+
+async def _write(
+    file: FileResponse,
+    path: Path,
+    segment: Segment,
+    chunk_size: int,
+) -> None:
+    handle: BinaryIO = await asyncio.to_thread(open, path, "r+b")
+    try:
+        await asyncio.to_thread(handle.seek, segment.position)
+        async for chunk in file.iter_chunked(chunk_size):
+            chunk = chunk[: segment.end + 1 - segment.position]
+            await asyncio.to_thread(handle.write, chunk)
+            segment.position += len(chunk)
+            if segment.completed:
+                break
+    finally:
+        await file.close()
+        await asyncio.to_thread(handle.close)
+
+
+class Downloader:
+    """
+    Downloads content of the streaming method right into the file,
+    using concurrent HTTP Range requests when the server supports them.
+    """
+
+    client: Stollen
+    request: StollenRequest
+    path: Path
+    segments: int
+    attempts: int
+    request_timeout: Optional[int]
+
+    def __init__(
+        self,
+        client: Stollen,
+        method: StollenStreamingMethod[Any],
+        path: Union[str, Path],
+        segments: int = 1,
+        attempts: int = DEFAULT_SEGMENT_ATTEMPTS,
+        request_timeout: Optional[int] = None,
+    ) -> None:
+        if segments < 1:
+            raise ValueError("Number of segments must be a positive integer!")
+        request: StollenRequest = client.session.serializer.to_request(
+            client=client,
+            method=method,
+        )
+        self.client = client
+        self.request = request.model_copy(update={"stream_mode": StreamMode.LIVE})
+        self.path = Path(path)
+        self.segments = segments
+        self.attempts = attempts
+        self.request_timeout = request_timeout
+
+    @property
+    def chunk_size(self) -> int:
+        return self.request.stream_chunk_size or DEFAULT_CHUNK_SIZE
+
+    async def _fetch(self, start: int, end: Optional[int]) -> tuple[StollenResponse, FileResponse]:
+        request: StollenRequest = self.request.model_copy(
+            update={
+                "headers": {
+                    **self.request.headers,
+                    "Range": f"bytes={start}-{end if end is not None else ''}",
+                },
+            },
+        )
+        response, file = await self.client.session.raw_request(
+            client=self.client,
+            request=request,
+            request_timeout=self.request_timeout,
+        )
+        return response, file
+
+    async def _download_segment(
+        self,
+        segment: Segment,
+        file: Optional[FileResponse] = None,
+    ) -> None:
+        transient_errors: tuple[type[BaseException], ...] = self.client.session.transient_errors
+        for attempt in range(1, self.attempts + 1):
+            try:
+                if file is None:
+                    response, file = await self._fetch(segment.position, segment.end)
+                    content_range = parse_content_range(response)
+                    if content_range is None or content_range[0] != segment.position:
+                        await file.close()
+                        raise RuntimeError(f"Server has not respected the range of {segment}!")
+                await _write(
+                    file=file,
+                    path=self.path,
+                    segment=segment,
+                    chunk_size=self.chunk_size,
+                )
+            except transient_errors:
+                # Resume from the last written byte
+                if attempt >= self.attempts:
+                    raise
+            if segment.completed:
+                return
+            file = None
+        raise RuntimeError(f"Connection has been closed before {segment} is completed!")
+
+    async def download(self) -> int:
+        response, file = await self._fetch(0, None)
+        content_range = parse_content_range(response)
+        if content_range is None or content_range[2] is None:
+            # Ranges are not supported, so the whole content is streamed at once
+            await asyncio.to_thread(_preallocate, self.path, 0)
+            segment: Segment = Segment(start=0, end=(1 << 63) - 1, position=0)
+            await _write(file=file, path=self.path, segment=segment, chunk_size=self.chunk_size)
+            return segment.position
+
+        total: int = content_range[2]
+        await asyncio.to_thread(_preallocate, self.path, total)
+        if not total:
+            await file.close()
+            return 0
+
+        size: int = -(-total // min(self.segments, total))
+        segments: list[Segment] = [
+            Segment(start=start, end=min(start + size, total) - 1, position=start)
+            for start in range(0, total, size)
+        ]
+        # The probe response is already streaming from the beginning, so it fills the first one
+        tasks: list[asyncio.Task[None]] = [
+            asyncio.ensure_future(self._download_segment(segments[0], file=file)),
+            *(asyncio.ensure_future(self._download_segment(s)) for s in segments[1:]),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return total
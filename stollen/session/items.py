@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Optional, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+from ..utils.binding import Binder, get_binder
+from ..utils.construct import construct
+
+if TYPE_CHECKING:
+    from ..method import StollenMethod
+
+_ARRAY_TYPES: tuple[Any, ...] = (list, tuple, set, frozenset, Sequence, Iterable)
+
+
+def get_item_type(method_type: type[StollenMethod[Any, Any]]) -> Any:
+    returning: Any = method_type.returning
+    args: tuple[Any, ...] = get_args(returning)
+    if get_origin(returning) not in _ARRAY_TYPES or not args:
+        msg: str = f"Method `{method_type.__name__}` must return an array to stream its items!"
+        raise TypeError(msg)
+    return args[0]
+
+
+@lru_cache(maxsize=None)
+def _item_adapter(item_type: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(item_type)
+
+
+def get_item_validator(
+    method_type: type[StollenMethod[Any, Any]],
+    client: Any,
+    trusted: bool = False,
+) -> Callable[[Any], Any]:
+    item_type: Any = get_item_type(method_type)
+    validate: Callable[[Any], Any] = (
+        partial(construct, item_type, client=client)
+        if trusted
+        else partial(_item_adapter(item_type).validate_python, context={"client": client})
+    )
+    binder: Optional[Binder] = get_binder(item_type)
+    if binder is None:
+        return validate
+    # Items of the same response share private attributes, just like regular responses
+    private: dict[str, Any] = {"_client": client}
+
+    def validate_item(data: Any) -> Any:
+        item: Any = validate(data)
+        if item is not None:
+            binder(item, private)
+        return item
+
+    return validate_item
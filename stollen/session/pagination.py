@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncIterator, ClassVar, Optional, Sequence
+
+from ..utils.concurrency import discard_tasks
+
+if TYPE_CHECKING:
+    from ..client import Stollen
+    from ..method import StollenMethod
+
+DEFAULT_PREFETCH = 4
+
+
+def _get(value: Any, key: str) -> Any:
+    if isinstance(value, dict):
+        return value.get(key)
+    return getattr(value, key, None)
+
+
+class Pagination(ABC):
+    """
+    Strategy of building the method of every page, declared on the method class:
+
+    .. code-block:: python
+
+        class GetUsers(
+            StollenMethod[UsersPage, Client],
+            http_method=HTTPMethod.GET,
+            api_method="/users",
+            returning=UsersPage,
+            pagination=OffsetPagination(items_key="users"),
+        ):
+            offset: int = 0
+            limit: int = 100
+    """
+
+    # Strategies addressing pages by number allow fetching them concurrently
+    prefetchable: ClassVar[bool] = True
+    items_key: Optional[str]
+
+    def __init__(self, items_key: Optional[str] = None) -> None:
+        """
+        :param items_key: Attribute (or key) of the page holding items.
+            By default, the page is a sequence of items itself.
+        """
+        self.items_key = items_key
+
+    def get_items(self, page: Any) -> Sequence[Any]:
+        items: Any = page if self.items_key is None else _get(page, self.items_key)
+        return items or ()
+
+    def is_last(self, method: StollenMethod[Any, Any], items: Sequence[Any]) -> bool:
+        return not items
+
+    @abstractmethod
+    def page_method(
+        self,
+        method: StollenMethod[Any, Any],
+        number: int,
+        previous: Any,
+    ) -> Optional[StollenMethod[Any, Any]]:
+        """
+        Build the method of the page with the number (starting from zero).
+        Previous page is passed only to strategies, that can't be prefetched.
+        """
+
+
+class OffsetPagination(Pagination):
+    offset_field: str
+    limit_field: str
+
+    def __init__(
+        self,
+        offset_field: str = "offset",
+        limit_field: str = "limit",
+        items_key: Optional[str] = None,
+    ) -> None:
+        """
+        :param offset_field: Field of the method with offset of the first item.
+        :param limit_field: Field of the method with number of items per page.
+        :param items_key: Attribute (or key) of the page holding items.
+        """
+        super().__init__(items_key=items_key)
+        self.offset_field = offset_field
+        self.limit_field = limit_field
+
+    def is_last(self, method: StollenMethod[Any, Any], items: Sequence[Any]) -> bool:
+        # Short page is the last one
+        limit: Optional[int] = getattr(method, self.limit_field)
+        return not items or (limit is not None and len(items) < limit)
+
+    def page_method(
+        self,
+        method: StollenMethod[Any, Any],
+        number: int,
+        previous: Any,
+    ) -> Optional[StollenMethod[Any, Any]]:
+        limit: Optional[int] = getattr(method, self.limit_field)
+        if limit is None:
+            msg: str = f"Field `{self.limit_field}` must be set to paginate by offset!"
+            raise ValueError(msg)
+        offset: int = getattr(method, self.offset_field) or 0
+        return method.model_copy(update={self.offset_field: offset + number * limit})
+
+
+class PagePagination(Pagination):
+    page_field: str
+    start: int
+
+    def __init__(
+        self,
+        page_field: str = "page",
+        start: int = 1,
+        items_key: Optional[str] = None,
+    ) -> None:
+        """
+        :param page_field: Field of the method with the page number.
+        :param start: Number of the first page, used if the field is not set.
+        :param items_key: Attribute (or key) of the page holding items.
+        """
+        super().__init__(items_key=items_key)
+        self.page_field = page_field
+        self.start = start
+
+    def page_method(
+        self,
+        method: StollenMethod[Any, Any],
+        number: int,
+        previous: Any,
+    ) -> Optional[StollenMethod[Any, Any]]:
+        start: Optional[int] = getattr(method, self.page_field)
+        first: int = start if start is not None else self.start
+        return method.model_copy(update={self.page_field: first + number})
+
+
+class CursorPagination(Pagination):
+    """
+    Every page refers to the next one, so pages are fetched one by one,
+    while the next page is requested as soon as the current one is received.
+    """
+
+    prefetchable = False
+    cursor_field: str
+    next_cursor_key: str
+
+    def __init__(
+        self,
+        cursor_field: str = "cursor",
+        next_cursor_key: str = "next_cursor",
+        items_key: Optional[str] = None,
+    ) -> None:
+        """
+        :param cursor_field: Field of the method with the cursor.
+        :param next_cursor_key: Attribute (or key) of the page with the cursor of the next one.
+        :param items_key: Attribute (or key) of the page holding items.
+        """
+        super().__init__(items_key=items_key)
+        self.cursor_field = cursor_field
+        self.next_cursor_key = next_cursor_key
+
+    def page_method(
+        self,
+        method: StollenMethod[Any, Any],
+        number: int,
+        previous: Any,
+    ) -> Optional[StollenMethod[Any, Any]]:
+        if number == 0:
+            return method
+        cursor: Any = _get(previous, self.next_cursor_key)
+        if not cursor:
+            return None
+        return method.model_copy(update={self.cursor_field: cursor})
+
+
+class Paginator:
+    """
+    Iterates over items of all pages of the method,
+    keeping up to ``prefetch`` next pages in flight while the current one is consumed.
+    """
+
+    client: Stollen
+    method: StollenMethod[Any, Any]
+    pagination: Pagination
+    prefetch: int
+    max_pages: Optional[int]
+    request_timeout: Optional[int]
+
+    def __init__(
+        self,
+        client: Stollen,
+        method: StollenMethod[Any, Any],
+        prefetch: int = DEFAULT_PREFETCH,
+        max_pages: Optional[int] = None,
+        request_timeout: Optional[int] = None,
+    ) -> None:
+        pagination: Optional[Pagination] = type(method).pagination
+        if pagination is None:
+            msg: str = f"Method `{type(method).__name__}` is declared without pagination!"
+            raise TypeError(msg)
+        if prefetch < 1:
+            raise ValueError("Number of prefetched pages must be a positive integer!")
+        self.client = client
+        self.method = method
+        self.pagination = pagination
+        self.prefetch = prefetch if pagination.prefetchable else 1
+        self.max_pages = max_pages
+        self.request_timeout = request_timeout
+        self._scheduled = 0
+
+    def _schedule(self, pages: deque[asyncio.Future[Any]], previous: Any = None) -> None:
+        if self.max_pages is not None and self._scheduled >= self.max_pages:
+            return
+        method: Optional[StollenMethod[Any, Any]] = self.pagination.page_method(
+            self.method,
+            number=self._scheduled,
+            previous=previous,
+        )
+        if method is None:
+            return
+        pages.append(
+            asyncio.ensure_future(self.client(method, request_timeout=self.request_timeout))
+        )
+        self._scheduled += 1
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        pages: deque[asyncio.Future[Any]] = deque()
+        try:
+            for _ in range(self.prefetch):
+                self._schedule(pages)
+            while pages:
+                page: Any = await pages.popleft()
+                items: Sequence[Any] = self.pagination.get_items(page)
+                last: bool = self.pagination.is_last(self.method, items)
+                if not last:
+                    # The next page is requested before the current one is consumed
+                    self._schedule(pages, previous=page)
+                for item in items:
+                    yield item
+                if last:
+                    return
+        finally:
+            discard_tasks(pages)
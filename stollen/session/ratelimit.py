@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Hashable, Optional
+
+from ..utils.headers import parse_rate_limit_reset, parse_retry_after
+
+if TYPE_CHECKING:
+    from ..requests import StollenRequest, StollenResponse
+
+DEFAULT_RATE_LIMIT_PENALTY = 1.0
+
+
+@dataclass(frozen=True)
+class Rate:
+    """
+    Allows ``limit`` requests per ``period`` seconds,
+    with bursts of up to ``burst`` requests (defaults to ``limit``).
+    """
+
+    limit: float
+    period: float = 1.0
+    burst: Optional[float] = None
+
+    @property
+    def per_second(self) -> float:
+        return self.limit / self.period
+
+    @property
+    def capacity(self) -> float:
+        return self.burst if self.burst is not None else max(self.limit, 1.0)
+
+
+class TokenBucket:
+    """
+    Token bucket with FIFO waiters.
+    Without rate it never runs out of tokens, but still can be blocked.
+    """
+
+    rate: Optional[Rate]
+    _tokens: float
+    _updated_at: float
+    _blocked_until: float
+    _lock: asyncio.Lock
+
+    def __init__(self, rate: Optional[Rate] = None) -> None:
+        self.rate = rate
+        self._tokens = rate.capacity if rate is not None else 0.0
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _delay(self, now: float) -> float:
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self.rate is None:
+            return 0.0
+        self._tokens = min(
+            self.rate.capacity,
+            self._tokens + max(now - self._updated_at, 0.0) * self.rate.per_second,
+        )
+        self._updated_at = max(self._updated_at, now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate.per_second
+
+    async def acquire(self) -> None:
+        if (
+            self.rate is None
+            and not self._lock.locked()
+            and self._blocked_until <= time.monotonic()
+        ):
+            return
+        # Lock waiters are woken up in FIFO order, so nobody is spinning
+        async with self._lock:
+            while True:
+                delay: float = self._delay(time.monotonic())
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            if self.rate is not None:
+                self._tokens -= 1
+
+    def block(self, delay: float) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self._tokens = min(self._tokens, 0.0)
+        # The quota is spent until the block ends, so tokens start refilling from there
+        self._updated_at = max(self._updated_at, self._blocked_until)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiting with token buckets on several scopes:
+    all requests, every resolved subdomain and every method class.
+
+    Subdomain buckets also learn from responses: ``429 Too Many Requests``,
+    ``Retry-After`` and exhausted ``X-RateLimit-*`` quotas pause
+    further requests to the same subdomain until the quota is restored.
+    """
+
+    global_rate: Optional[Rate]
+    subdomain_rate: Optional[Rate]
+    method_rate: Optional[Rate]
+    subdomain_rates: dict[Optional[str], Rate]
+    method_rates: dict[type[Any], Rate]
+    learn: bool
+    penalty: float
+
+    def __init__(
+        self,
+        *,
+        global_rate: Optional[Rate] = None,
+        subdomain_rate: Optional[Rate] = None,
+        method_rate: Optional[Rate] = None,
+        subdomain_rates: Optional[dict[Optional[str], Rate]] = None,
+        method_rates: Optional[dict[type[Any], Rate]] = None,
+        learn: bool = True,
+        penalty: float = DEFAULT_RATE_LIMIT_PENALTY,
+    ) -> None:
+        """
+        :param global_rate: Rate of all requests.
+        :param subdomain_rate: Default rate of requests to every subdomain.
+        :param method_rate: Default rate of requests of every method class.
+        :param subdomain_rates: Rates of specific subdomains.
+        :param method_rates: Rates of specific method classes.
+        :param learn: Pause requests according to rate limit responses.
+        :param penalty: Pause in seconds after 429 response without ``Retry-After``.
+        """
+        self.global_rate = global_rate
+        self.subdomain_rate = subdomain_rate
+        self.method_rate = method_rate
+        self.subdomain_rates = subdomain_rates or {}
+        self.method_rates = method_rates or {}
+        self.learn = learn
+        self.penalty = penalty
+        self._buckets: dict[Hashable, TokenBucket] = {}
+
+    def _bucket(self, key: Hashable, rate: Optional[Rate]) -> TokenBucket:
+        bucket: Optional[TokenBucket] = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(rate)
+        return bucket
+
+    def _subdomain_bucket(self, request: StollenRequest) -> TokenBucket:
+        return self._bucket(
+            ("subdomain", request.subdomain),
+            self.subdomain_rates.get(request.subdomain, self.subdomain_rate),
+        )
+
+    async def acquire(self, request: StollenRequest) -> None:
+        # From the most specific scope to the least one,
+        # so that wider quotas are not held while waiting for narrower ones
+        if request.method_type is not None:
+            rate: Optional[Rate] = self.method_rates.get(request.method_type, self.method_rate)
+            if rate is not None:
+                await self._bucket(("method", request.method_type), rate).acquire()
+        await self._subdomain_bucket(request).acquire()
+        if self.global_rate is not None:
+            await self._bucket("global", self.global_rate).acquire()
+
+    def update(self, request: StollenRequest, response: StollenResponse) -> None:
+        if not self.learn:
+            return
+        delay: Optional[float] = parse_rate_limit_reset(response.headers)
+        if response.status_code in {429, 503}:
+            retry_after: Optional[float] = parse_retry_after(response.headers)
+            if retry_after is not None:
+                delay = retry_after
+            elif response.status_code == 429:
+                delay = delay or self.penalty
+        if delay:
+            self._subdomain_bucket(request).block(delay)
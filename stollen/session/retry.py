@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from .. import loggers
+from ..enums import HTTPMethod
+from ..utils.headers import parse_retry_after
+
+if TYPE_CHECKING:
+    from ..exceptions import StollenError
+    from ..requests import StollenRequest, StollenResponse
+
+T = TypeVar("T")
+
+DEFAULT_RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Token bucket limiting the share of retries, so that they can't grow
+    into a retry storm while an upstream is degraded.
+    Every request deposits ``ratio`` tokens, every retry withdraws one token,
+    and ``min_per_second`` tokens are deposited over time for low traffic.
+    """
+
+    ratio: float
+    min_per_second: float
+    max_tokens: float
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_per_second: float = 1.0,
+        max_tokens: float = 100.0,
+    ) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._updated_at = time.monotonic()
+
+    def _deposit(self, amount: float) -> None:
+        now: float = time.monotonic()
+        amount += (now - self._updated_at) * self.min_per_second
+        self._tokens = min(self.max_tokens, self._tokens + amount)
+        self._updated_at = now
+
+    def deposit(self) -> None:
+        self._deposit(self.ratio)
+
+    def withdraw(self) -> bool:
+        self._deposit(0.0)
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    attempts: int
+    status_codes: frozenset[int]
+    errors: tuple[type[StollenError], ...]
+    exceptions: Optional[tuple[type[BaseException], ...]]
+    retry_non_idempotent: bool
+    base_delay: float
+    max_delay: float
+    budget: Optional[RetryBudget]
+
+    def __init__(
+        self,
+        *,
+        attempts: int = 3,
+        status_codes: Iterable[int] = DEFAULT_RETRY_STATUS_CODES,
+        errors: Iterable[type[StollenError]] = (),
+        exceptions: Optional[Iterable[type[BaseException]]] = None,
+        retry_non_idempotent: bool = False,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """
+        Retry policy with decorrelated jitter backoff.
+
+        :param attempts: Maximum number of attempts, including the first one.
+        :param status_codes: Response status codes to retry on.
+        :param errors: API errors to retry on,
+            e.g. the ones mapped to status codes via ``error_codes``.
+        :param exceptions: Transport exceptions to retry on.
+            By default, the transient errors of the session are used.
+        :param retry_non_idempotent: Retry POST and PATCH requests as well.
+        :param base_delay: Minimum delay between attempts in seconds.
+        :param max_delay: Maximum delay between attempts in seconds,
+            requests asking to ``Retry-After`` a longer delay are not retried.
+        :param budget: Retry budget. By default, a new budget is created for the policy.
+        """
+        self.attempts = attempts
+        self.status_codes = frozenset(status_codes)
+        self.errors = tuple(errors)
+        self.exceptions = tuple(exceptions) if exceptions is not None else None
+        self.retry_non_idempotent = retry_non_idempotent
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def next_delay(self, previous: float) -> float:
+        return min(
+            self.max_delay,
+            random.uniform(self.base_delay, max(previous, self.base_delay) * 3),  # noqa: S311
+        )
+
+    def is_retryable(
+        self,
+        request: StollenRequest,
+        error: BaseException,
+        transient_errors: tuple[type[BaseException], ...],
+    ) -> bool:
+        if not self.retry_non_idempotent and not HTTPMethod.is_idempotent(request.http_method):
+            return False
+        if isinstance(error, self.exceptions or transient_errors):
+            return True
+        if isinstance(error, self.errors):
+            return True
+        response: Optional[StollenResponse] = getattr(error, "response", None)
+        return response is not None and response.status_code in self.status_codes
+
+    async def execute(
+        self,
+        request: StollenRequest,
+        attempt: Callable[[], Awaitable[T]],
+        transient_errors: tuple[type[BaseException], ...] = (),
+    ) -> T:
+        """
+        Make attempts of the already serialized request until one succeeds
+        or the policy gives up.
+        """
+        if self.budget is not None:
+            self.budget.deposit()
+
+        delay: float = self.base_delay
+        for number in range(1, self.attempts + 1):
+            try:
+                return await attempt()
+            except Exception as error:
+                if number >= self.attempts or not self.is_retryable(
+                    request=request,
+                    error=error,
+                    transient_errors=transient_errors,
+                ):
+                    raise
+
+                delay = self.next_delay(delay)
+                response: Optional[StollenResponse] = getattr(error, "response", None)
+                retry_after: Optional[float] = (
+                    parse_retry_after(response.headers) if response is not None else None
+                )
+                if retry_after is not None:
+                    if retry_after > self.max_delay:
+                        raise
+                    delay = max(delay, retry_after)
+
+                if self.budget is not None and not self.budget.withdraw():
+                    raise
+
+                loggers.client.warning(
+                    "Retrying HTTP Request: %s %s (attempt=%d, delay=%dms, error=%r)",
+                    request.http_method,
+                    request.url,
+                    number + 1,
+                    delay * 1000,
+                    error,
+                )
+                await asyncio.sleep(delay)
+
+        raise RuntimeError("Retry policy must allow at least one attempt!")
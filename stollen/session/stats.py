@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .base import BaseSession
+    from .timing import RequestTimings
+
+# Buckets keep this number of significant bits, so the relative error is below 1%
+HISTOGRAM_PRECISION_BITS = 8
+DEFAULT_QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99)
+
+MethodKey = tuple[str, Optional[str]]
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of durations with log-linear buckets of microseconds.
+    Memory is bounded by the number of buckets, not by the number of values.
+    """
+
+    count: int
+    total: float
+    min: float
+    max: float
+    _buckets: Counter[int]
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        self._buckets = Counter()
+
+    @staticmethod
+    def _bucket(value: float) -> int:
+        micros: int = max(int(value * 1_000_000), 0)
+        shift: int = max(micros.bit_length() - HISTOGRAM_PRECISION_BITS, 0)
+        return (micros >> shift) << shift
+
+    def record(self, value: float) -> None:
+        if not self.count or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.count += 1
+        self.total += value
+        self._buckets[self._bucket(value)] += 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank: float = q * self.count
+        seen: int = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                # Bounds are exact, buckets are approximate
+                return min(max(bucket / 1_000_000, self.min), self.max)
+        return self.max
+
+    def snapshot(self, quantiles: tuple[float, ...] = DEFAULT_QUANTILES) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=self.count,
+            total=self.total,
+            min=self.min,
+            max=self.max,
+            quantiles={q: self.quantile(q) for q in quantiles},
+        )
+
+
+@dataclass()
+class HistogramSnapshot:
+    count: int
+    total: float
+    min: float
+    max: float
+    quantiles: dict[float, float]
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+@dataclass()
+class MethodStats:
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    status_codes: Counter[int] = field(default_factory=Counter)
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass()
+class MethodSnapshot:
+    method: str
+    subdomain: Optional[str]
+    requests: int
+    errors: int
+    in_flight: int
+    bytes_sent: int
+    bytes_received: int
+    status_codes: dict[int, int]
+    latency: HistogramSnapshot
+
+
+@dataclass()
+class PoolSnapshot:
+    """
+    State of the connection pool: connections in use, idle ones kept alive
+    and requests waiting for a free slot.
+    Connections are counted by host only if the pool is limited per host.
+    """
+
+    limit: int
+    limit_per_host: int
+    acquired: int
+    idle: int
+    waiters: int
+    acquired_per_host: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def utilization(self) -> float:
+        return self.acquired / self.limit if self.limit else 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    pairs: list[str] = [
+        f'{name}="{_escape(str(value))}"' for name, value in labels.items() if value is not None
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _PrometheusWriter:
+    prefix: str
+    lines: list[str]
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self.lines = []
+
+    def family(self, name: str, metric_type: str) -> None:
+        self.lines.append(f"# TYPE {self.prefix}_{name} {metric_type}")
+
+    def sample(self, name: str, value: Any, **labels: Any) -> None:
+        self.lines.append(f"{self.prefix}_{name}{_labels(**labels)} {value}")
+
+    def render(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+@dataclass()
+class StatsSnapshot:
+    methods: list[MethodSnapshot]
+    pool: Optional[PoolSnapshot] = None
+
+    @property
+    def in_flight(self) -> int:
+        return sum(method.in_flight for method in self.methods)
+
+    def _write_methods(self, writer: _PrometheusWriter) -> None:
+        writer.family("request_duration_seconds", "summary")
+        for method in self.methods:
+            labels: dict[str, Any] = {"method": method.method, "subdomain": method.subdomain}
+            for q, duration in method.latency.quantiles.items():
+                writer.sample("request_duration_seconds", duration, **labels, quantile=q)
+            writer.sample("request_duration_seconds_sum", method.latency.total, **labels)
+            writer.sample("request_duration_seconds_count", method.latency.count, **labels)
+
+        writer.family("responses_total", "counter")
+        for method in self.methods:
+            for status_code, count in sorted(method.status_codes.items()):
+                writer.sample(
+                    "responses_total",
+                    count,
+                    method=method.method,
+                    subdomain=method.subdomain,
+                    status=status_code,
+                )
+
+        for name, metric_type, attribute in (
+            ("request_errors_total", "counter", "errors"),
+            ("sent_bytes_total", "counter", "bytes_sent"),
+            ("received_bytes_total", "counter", "bytes_received"),
+            ("requests_in_flight", "gauge", "in_flight"),
+        ):
+            writer.family(name, metric_type)
+            for method in self.methods:
+                value: int = getattr(method, attribute)
+                writer.sample(name, value, method=method.method, subdomain=method.subdomain)
+
+    def _write_pool(self, writer: _PrometheusWriter, pool: PoolSnapshot) -> None:
+        for name, value in (
+            ("pool_limit", pool.limit),
+            ("pool_acquired_connections", pool.acquired),
+            ("pool_idle_connections", pool.idle),
+            ("pool_waiters", pool.waiters),
+        ):
+            writer.family(name, "gauge")
+            writer.sample(name, value)
+        writer.family("pool_host_acquired_connections", "gauge")
+        for host, count in sorted(pool.acquired_per_host.items()):
+            writer.sample("pool_host_acquired_connections", count, host=host)
+
+    def to_prometheus(self, prefix: str = "stollen") -> str:
+        """
+        Render the snapshot in Prometheus text exposition format.
+        """
+        writer: _PrometheusWriter = _PrometheusWriter(prefix=prefix)
+        self._write_methods(writer)
+        if self.pool is not None:
+            self._write_pool(writer, self.pool)
+        return writer.render()
+
+
+class StatsRegistry:
+    """
+    In-process aggregation of request timings by method and subdomain.
+    It's registered as timing hooks of the session, so nothing is collected without it.
+    """
+
+    quantiles: tuple[float, ...]
+    _methods: dict[MethodKey, MethodStats]
+
+    def __init__(self, quantiles: tuple[float, ...] = DEFAULT_QUANTILES) -> None:
+        """
+        :param quantiles: Latency quantiles included in snapshots.
+        """
+        self.quantiles = quantiles
+        self._methods = {}
+
+    def attach(self, session: BaseSession) -> None:
+        session.add_start_hook(self.on_start)
+        session.add_timing_hook(self.on_finish)
+
+    def _get(self, timings: RequestTimings) -> MethodStats:
+        key: MethodKey = (timings.method_name or "unknown", timings.subdomain)
+        stats: Optional[MethodStats] = self._methods.get(key)
+        if stats is None:
+            stats = self._methods[key] = MethodStats()
+        return stats
+
+    def on_start(self, timings: RequestTimings) -> None:
+        self._get(timings).in_flight += 1
+
+    def on_finish(self, timings: RequestTimings) -> None:
+        stats: MethodStats = self._get(timings)
+        stats.in_flight -= 1
+        stats.requests += 1
+        if timings.error is not None:
+            stats.errors += 1
+        if timings.status_code is not None:
+            stats.status_codes[timings.status_code] += 1
+        stats.bytes_sent += timings.bytes_sent
+        stats.bytes_received += timings.bytes_received
+        stats.latency.record(timings.total)
+
+    def reset(self) -> None:
+        # Requests in flight are still counted
+        self._methods = {
+            key: MethodStats(in_flight=stats.in_flight)
+            for key, stats in self._methods.items()
+            if stats.in_flight
+        }
+
+    def snapshot(self, pool: Optional[PoolSnapshot] = None) -> StatsSnapshot:
+        return StatsSnapshot(
+            methods=[
+                MethodSnapshot(
+                    method=method,
+                    subdomain=subdomain,
+                    requests=stats.requests,
+                    errors=stats.errors,
+                    in_flight=stats.in_flight,
+                    bytes_sent=stats.bytes_sent,
+                    bytes_received=stats.bytes_received,
+                    status_codes=dict(stats.status_codes),
+                    latency=stats.latency.snapshot(self.quantiles),
+                )
+                for (method, subdomain), stats in self._methods.items()
+            ],
+            pool=pool,
+        )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from .. import loggers
+
+if TYPE_CHECKING:
+    from ..requests import StollenRequest
+
+
+@dataclass()
+class RequestTimings:
+    """
+    Durations of the request phases in seconds, labelled by the method and subdomain.
+    Phases of retried requests are summed up over all the attempts.
+
+    ``connect`` is the time of establishing a new connection (including TLS handshake),
+    not including ``dns``, both are zero for reused connections.
+    ``queue`` is the time of waiting for a free slot of the connection pool,
+    ``throttle`` is the time of waiting for the rate limiter.
+    Sizes of multipart bodies and streamed responses are not counted.
+    """
+
+    method_type: Optional[type[Any]] = None
+    subdomain: Optional[str] = None
+    started_at: float = 0.0
+    serialize: float = 0.0
+    throttle: float = 0.0
+    queue: float = 0.0
+    dns: float = 0.0
+    connect: float = 0.0
+    ttfb: float = 0.0
+    body: float = 0.0
+    decode: float = 0.0
+    validate: float = 0.0
+    total: float = 0.0
+    attempts: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    status_code: Optional[int] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def method_name(self) -> Optional[str]:
+        return self.method_type.__name__ if self.method_type is not None else None
+
+    @property
+    def transport(self) -> float:
+        """
+        Time spent by the connection pool and the network, excluding body reading.
+        """
+        return self.queue + self.dns + self.connect + self.ttfb
+
+    def bind(self, request: StollenRequest) -> None:
+        self.method_type = request.method_type
+        self.subdomain = request.subdomain
+        request.timings = self
+
+    def finish(self) -> None:
+        self.total = perf_counter() - self.started_at
+
+
+TimingHook = Callable[[RequestTimings], Any]
+
+
+def start_timings() -> RequestTimings:
+    return RequestTimings(started_at=perf_counter())
+
+
+def emit_timings(hooks: list[TimingHook], timings: RequestTimings) -> None:
+    for hook in hooks:
+        try:
+            hook(timings)
+        except Exception:
+            # Instrumentation must never break requests
+            loggers.client.exception("Timing hook %r has failed", hook)
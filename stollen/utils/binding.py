@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Optional, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from ..client.context_controller import LazyStollenContextController
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+else:  # pragma: no cover
+    UnionType = Union
+
+Binder = Callable[[Any, dict[str, Any]], None]
+
+_binders: dict[Any, Optional[Binder]] = {}
+
+
+def _may_contain_lazy(annotation: Any, seen: set[type[BaseModel]]) -> bool:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if issubclass(annotation, LazyStollenContextController):
+            return True
+        if annotation in seen:
+            return False
+        seen.add(annotation)
+        if not annotation.__pydantic_complete__:
+            annotation.model_rebuild()
+        return any(
+            _may_contain_lazy(field.annotation, seen) for field in annotation.model_fields.values()
+        )
+    return any(_may_contain_lazy(arg, seen) for arg in get_args(annotation))
+
+
+def _bind_dynamic(value: Any, private: dict[str, Any]) -> None:
+    if isinstance(value, BaseModel):
+        binder: Optional[Binder] = get_binder(type(value))
+        if binder is not None:
+            binder(value, private)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            _bind_dynamic(item, private)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _bind_dynamic(item, private)
+
+
+def _items(item: Binder) -> Binder:
+    def bind(value: Any, private: dict[str, Any]) -> None:
+        for v in value:
+            if v is not None:
+                item(v, private)
+
+    return bind
+
+
+def _values(item: Binder) -> Binder:
+    def bind(value: Any, private: dict[str, Any]) -> None:
+        for v in value.values():
+            if v is not None:
+                item(v, private)
+
+    return bind
+
+
+class _ModelBinder:
+    """
+    Binds the object, if it's lazy, and its fields, that may contain lazy objects.
+    Fields are resolved on the first call, so that recursive models are supported.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        from ..object import CompactStollenObject
+
+        self.model = model
+        self.lazy = issubclass(model, LazyStollenContextController)
+        self.fields: Optional[list[tuple[str, Binder]]] = None
+        # Sets of fields shared by compact objects of this type, the full one is the most common
+        self.compact = issubclass(model, CompactStollenObject)
+        self.full_fields_set: set[str] = set(model.model_fields)
+        self.fields_sets: dict[frozenset[str], set[str]] = {}
+
+    def _share_fields_set(self, obj: Any) -> None:
+        fields_set: set[str] = obj.__pydantic_fields_set__
+        shared: Optional[set[str]]
+        if len(fields_set) == len(self.full_fields_set):
+            shared = self.full_fields_set
+        else:
+            key: frozenset[str] = frozenset(fields_set)
+            shared = self.fields_sets.get(key)
+            if shared is None:
+                shared = self.fields_sets[key] = fields_set
+        object.__setattr__(obj, "__pydantic_fields_set__", shared)
+
+    def _resolve(self) -> list[tuple[str, Binder]]:
+        fields: list[tuple[str, Binder]] = []
+        for name, field in self.model.model_fields.items():
+            binder: Optional[Binder] = get_binder(field.annotation)
+            if binder is not None:
+                fields.append((name, binder))
+        self.fields = fields
+        return fields
+
+    def __call__(self, obj: Any, private: dict[str, Any]) -> None:
+        if self.lazy:
+            object.__setattr__(obj, "__pydantic_private__", private)
+            if self.compact:
+                self._share_fields_set(obj)
+        fields: list[tuple[str, Binder]] = (
+            self.fields if self.fields is not None else self._resolve()
+        )
+        values: dict[str, Any] = obj.__dict__
+        for name, binder in fields:
+            value: Any = values.get(name)
+            if value is not None:
+                binder(value, private)
+
+
+def _build(annotation: Any) -> Binder:
+    origin: Any = get_origin(annotation)
+    args: tuple[Any, ...] = get_args(annotation)
+    if origin is Annotated:
+        return get_binder(args[0]) or _bind_dynamic
+    if origin in (list, set, frozenset, Sequence) or (
+        origin is tuple and len(args) == 2 and args[1] is Ellipsis
+    ):
+        item: Optional[Binder] = get_binder(args[0])
+        return _items(item) if item is not None else _bind_dynamic
+    if origin in (dict, Mapping) and len(args) == 2:
+        value: Optional[Binder] = get_binder(args[1])
+        return _values(value) if value is not None else _bind_dynamic
+    if origin is Union or origin is UnionType:
+        members: list[Any] = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return get_binder(members[0]) or _bind_dynamic
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _ModelBinder(annotation)
+    # Picking a member of the union or a tuple item requires checking the value itself
+    return _bind_dynamic
+
+
+def get_binder(annotation: Any) -> Optional[Binder]:
+    """
+    Get the function binding lazy objects in values of the annotated type,
+    or None, if there can't be any.
+    """
+    try:
+        if annotation in _binders:
+            return _binders[annotation]
+    except TypeError:
+        # Unhashable annotation metadata
+        return _build(annotation) if _may_contain_lazy(annotation, set()) else None
+    binder: Optional[Binder] = None
+    if _may_contain_lazy(annotation, set()):
+        # Cached before it's used, so that recursive models refer to the same binder
+        binder = _binders[annotation] = _build(annotation)
+    else:
+        _binders[annotation] = None
+    return binder
+
+
+def bind_client(annotation: Any, value: Any, client: Any) -> None:
+    """
+    Bind lazy objects in the value of the annotated type (including the value itself)
+    to the client. All of them share the same private attributes,
+    so binding a whole response costs a single pass over its lazy objects
+    and the fields, that may contain them.
+    """
+    binder: Optional[Binder] = get_binder(annotation)
+    if binder is not None and value is not None:
+        binder(value, {"_client": client})
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def iterate(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _task_result(task: asyncio.Future[Any], return_exceptions: bool) -> Any:
+    error: Optional[BaseException] = task.exception()
+    if error is None:
+        return task.result()
+    if return_exceptions and isinstance(error, Exception):
+        return error
+    raise error
+
+
+def discard_tasks(tasks: Iterable[asyncio.Future[Any]]) -> None:
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled():
+            # Mark exception as retrieved, the batch is already failed
+            task.exception()
+
+
+async def map_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Union[Iterable[T], AsyncIterable[T]],
+    *,
+    limit: int,
+    return_exceptions: bool = False,
+) -> AsyncIterator[tuple[int, T, Union[R, BaseException]]]:
+    """
+    Run ``func`` over items with at most ``limit`` calls in flight,
+    yielding ``(index, item, result)`` as calls complete.
+    Items are pulled lazily, so no more than ``limit`` tasks exist at once.
+    """
+    if limit < 1:
+        raise ValueError("Concurrency limit must be a positive integer!")
+
+    source: AsyncIterator[T] = iterate(items)
+    pending: dict[asyncio.Future[R], tuple[int, T]] = {}
+    index: int = 0
+    exhausted: bool = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    item: T = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending[asyncio.ensure_future(func(item))] = (index, item)
+                index += 1
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task_index, task_item = pending.pop(task)
+                yield task_index, task_item, _task_result(task, return_exceptions)
+    finally:
+        discard_tasks(pending)
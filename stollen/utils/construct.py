@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import inspect
+import sys
+from collections.abc import Mapping, Sequence
+from enum import Enum
+from typing import Any, Callable, Literal, Optional, Union, cast, get_args, get_origin
+
+from pydantic import AliasChoices, BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo, ModelPrivateAttr
+from pydantic_core import PydanticUndefined
+from typing_extensions import Annotated
+
+if sys.version_info >= (3, 10):
+    from types import NoneType, UnionType
+else:  # pragma: no cover
+    NoneType = type(None)
+    UnionType = Union
+
+Constructor = Callable[[Any, Any], Any]
+
+
+class ConstructError(ValueError):
+    """
+    Trusted data can't be built into the annotated type without validation.
+    """
+
+
+_IDENTITY_TYPES: frozenset[Any] = frozenset({Any, object, str, int, float, bool, bytes, NoneType})
+_constructors: dict[tuple[Any, bool], Constructor] = {}
+
+
+def _identity(value: Any, client: Any) -> Any:
+    return value
+
+
+def _fallback(annotation: Any) -> Constructor:
+    adapter: Optional[TypeAdapter[Any]] = None
+
+    def validate(value: Any, client: Any) -> Any:
+        nonlocal adapter
+        if adapter is None:
+            adapter = TypeAdapter(annotation)
+        return adapter.validate_python(value, context={"client": client})
+
+    return validate
+
+
+def _optional(item: Constructor) -> Constructor:
+    def construct(value: Any, client: Any) -> Any:
+        return None if value is None else item(value, client)
+
+    return construct
+
+
+def _sequence(origin: Any, item: Constructor) -> Constructor:
+    if item is _identity:
+        return lambda value, client: origin(value)
+    return lambda value, client: origin(item(v, client) for v in value)
+
+
+def _mapping(item: Constructor) -> Constructor:
+    if item is _identity:
+        return lambda value, client: dict(value)
+    return lambda value, client: {k: item(v, client) for k, v in value.items()}
+
+
+def _binds_client_only(model: type[BaseModel]) -> bool:
+    from ..client.context_controller import StollenContextController
+
+    # Pydantic wraps model_post_init in every subclass with private attributes
+    return inspect.unwrap(model.model_post_init) is inspect.unwrap(
+        StollenContextController.model_post_init
+    )
+
+
+# Name, key, alternative keys and constructor of the field
+_FieldPlan = tuple[str, str, tuple[str, ...], Optional[Constructor]]
+_MISSING: Any = object()
+# Defaults of these types are shared by pydantic as well
+_IMMUTABLE_TYPES: tuple[type[Any], ...] = (
+    str,
+    int,
+    float,
+    bool,
+    bytes,
+    tuple,
+    frozenset,
+    NoneType,
+)
+
+
+class _ModelConstructor:
+    """
+    Builds the model the same way as ``model_construct`` does,
+    but converts nested values and passes the client to ``model_post_init``.
+    Fields are resolved on the first call, so that recursive models are supported.
+    """
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        self.model = model
+        self.fields: Optional[list[_FieldPlan]] = None
+        self.defaults: dict[str, Any] = {}
+        self.default_fields: dict[str, FieldInfo] = {}
+        self.allow_extra = model.model_config.get("extra") == "allow"
+        self.post_init = bool(model.__pydantic_post_init__)
+        self.bind_client = self.post_init and _binds_client_only(model)
+        self.private: dict[str, ModelPrivateAttr] = {}
+        if self.bind_client:
+            # Context controllers only bind the client, so private attributes are set directly
+            self.private = {
+                name: attr
+                for name, attr in model.__private_attributes__.items()
+                if name != "_client"
+                and (attr.default is not PydanticUndefined or attr.default_factory is not None)
+            }
+
+    def _resolve(self) -> list[_FieldPlan]:
+        if not self.model.__pydantic_complete__:
+            self.model.model_rebuild()
+        use_enum_values: bool = bool(self.model.model_config.get("use_enum_values"))
+        fields: list[_FieldPlan] = []
+        for name, field in self.model.model_fields.items():
+            keys: list[str] = []
+            if field.alias is not None:
+                keys.append(field.alias)
+            if isinstance(field.validation_alias, str):
+                keys.append(field.validation_alias)
+            elif isinstance(field.validation_alias, AliasChoices):
+                keys.extend(a for a in field.validation_alias.choices if isinstance(a, str))
+            keys.append(name)
+            key, *aliases = dict.fromkeys(keys)
+            construct: Constructor = get_constructor(
+                field.annotation,
+                use_enum_values=use_enum_values,
+            )
+            fields.append(
+                (name, key, tuple(aliases), None if construct is _identity else construct)
+            )
+            if field.is_required():
+                continue
+            if field.default_factory is None and isinstance(field.default, _IMMUTABLE_TYPES):
+                self.defaults[name] = field.default
+            else:
+                self.default_fields[name] = field
+        self.fields = fields
+        return fields
+
+    def _fill_defaults(self, values: dict[str, Any]) -> None:
+        for name, default in self.defaults.items():
+            if name not in values:
+                values[name] = default
+        for name, field in self.default_fields.items():
+            if name not in values:
+                values[name] = field.get_default(call_default_factory=True)
+
+    def _extra(self, data: dict[str, Any]) -> dict[str, Any]:
+        extra: dict[str, Any] = dict(data)
+        for _, key, aliases, _ in cast(list[_FieldPlan], self.fields):
+            for name in (key, *aliases):
+                if extra.pop(name, _MISSING) is not _MISSING:
+                    break
+        return extra
+
+    def _bind(self, obj: Any, client: Any) -> None:
+        if self.bind_client:
+            private: dict[str, Any] = {"_client": client}
+            for name, attr in self.private.items():
+                private[name] = attr.get_default()
+            object.__setattr__(obj, "__pydantic_private__", private)
+            return
+        object.__setattr__(obj, "__pydantic_private__", None)
+        if self.post_init:
+            obj.model_post_init({"client": client})
+
+    def __call__(self, data: Any, client: Any) -> Any:
+        if isinstance(data, self.model):
+            return data
+        fields: list[_FieldPlan] = self.fields if self.fields is not None else self._resolve()
+        values: dict[str, Any] = {}
+        taken: int = 0
+        for name, key, aliases, construct in fields:
+            item: Any = data.get(key, _MISSING)
+            if item is _MISSING:
+                for alias in aliases:
+                    item = data.get(alias, _MISSING)
+                    if item is not _MISSING:
+                        break
+                else:
+                    continue
+            values[name] = item if construct is None else construct(item, client)
+            taken += 1
+        fields_set: set[str] = set(values)
+        if taken < len(fields):
+            self._fill_defaults(values)
+
+        obj: Any = self.model.__new__(self.model)
+        object.__setattr__(obj, "__dict__", values)
+        object.__setattr__(obj, "__pydantic_fields_set__", fields_set)
+        if self.allow_extra:
+            # Extra keys are collected only if there are keys, that have not been taken
+            object.__setattr__(
+                obj, "__pydantic_extra__", self._extra(data) if len(data) > taken else {}
+            )
+        else:
+            object.__setattr__(obj, "__pydantic_extra__", None)
+        self._bind(obj, client)
+        return obj
+
+
+def _build_generic(origin: Any, annotation: Any, use_enum_values: bool) -> Constructor:
+    args: tuple[Any, ...] = get_args(annotation)
+    item: Any = args[0] if args else Any
+    if origin is Annotated:
+        return get_constructor(item, use_enum_values=use_enum_values)
+    if origin is Literal:
+        return _identity
+    if origin is Union or origin is UnionType:
+        items: list[Any] = [arg for arg in args if arg is not NoneType]
+        if len(items) == 1:
+            return _optional(get_constructor(items[0], use_enum_values=use_enum_values))
+        # Picking a member of the union requires validation
+        return _fallback(annotation)
+    if origin in (list, Sequence):
+        return _sequence(list, get_constructor(item, use_enum_values=use_enum_values))
+    if origin in (set, frozenset):
+        return _sequence(origin, get_constructor(item, use_enum_values=use_enum_values))
+    if origin is tuple and (not args or (len(args) == 2 and args[1] is Ellipsis)):
+        return _sequence(tuple, get_constructor(item, use_enum_values=use_enum_values))
+    if origin in (dict, Mapping):
+        value: Any = args[1] if args else Any
+        return _mapping(get_constructor(value, use_enum_values=use_enum_values))
+    return _fallback(annotation)
+
+
+def _build(annotation: Any, use_enum_values: bool) -> Constructor:
+    if any(annotation is identity_type for identity_type in _IDENTITY_TYPES):
+        return _identity
+    origin: Any = get_origin(annotation)
+    if origin is not None:
+        return _build_generic(origin, annotation, use_enum_values=use_enum_values)
+    if isinstance(annotation, type):
+        factory: Any = annotation
+        if issubclass(annotation, BaseModel) and not annotation.__pydantic_root_model__:
+            return _ModelConstructor(annotation)
+        if issubclass(annotation, Enum):
+            return _identity if use_enum_values else lambda value, client: factory(value)
+        if annotation in (list, set, frozenset, tuple, dict):
+            return lambda value, client: factory(value)
+    # Datetimes, decimals, root models and the rest are left to pydantic
+    return _fallback(annotation)
+
+
+def get_constructor(annotation: Any, use_enum_values: bool = False) -> Constructor:
+    key: tuple[Any, bool] = (annotation, use_enum_values)
+    try:
+        constructor: Optional[Constructor] = _constructors.get(key)
+    except TypeError:
+        # Unhashable annotation metadata
+        return _build(annotation, use_enum_values)
+    if constructor is None:
+        constructor = _constructors[key] = _build(annotation, use_enum_values)
+    return constructor
+
+
+def construct(annotation: Any, data: Any, client: Any = None) -> Any:
+    """
+    Build the value of the annotated type from trusted data without validation.
+    Nested models are bound to the client just like validated ones.
+    Only the parts of data, that can't be built without validation
+    (e.g. datetimes or unions of several types), are still validated.
+
+    :raises ConstructError: If the data doesn't have the shape of the annotated type.
+    """
+    try:
+        return get_constructor(annotation)(data, client)
+    except (AttributeError, TypeError, KeyError, IndexError, ValueError) as error:
+        raise ConstructError(
+            f"Trusted data doesn't match {annotation!r}: {type(error).__name__}: {error}"
+        ) from error
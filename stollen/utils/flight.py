@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls with the same key into a single call.
+    Every caller receives the same result (or the same exception),
+    nothing is kept once the call is finished.
+    """
+
+    _calls: dict[Hashable, asyncio.Future[Any]]
+
+    def __init__(self) -> None:
+        self._calls = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        while (future := self._calls.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Leader has been cancelled, so someone has to take its place
+                if not future.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result: T = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark exception as retrieved, there may be no one waiting for it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterator, Mapping, MutableMapping, Optional
+
+# Values above this are treated as unix timestamps rather than delays
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+class HeadersView(MutableMapping[str, Any]):
+    """
+    View of the transport headers (e.g. case-insensitive multidict of aiohttp),
+    that is copied only once it's modified.
+    """
+
+    __slots__ = ("_headers", "_copied")
+
+    _headers: Mapping[str, Any]
+    _copied: bool
+
+    def __init__(self, headers: Mapping[str, Any]) -> None:
+        self._headers = headers
+        self._copied = False
+
+    def _mutable(self) -> MutableMapping[str, Any]:
+        if not self._copied:
+            # Multidicts are copied into mutable ones, keeping case-insensitive lookups
+            copy: Any = getattr(self._headers, "copy", None)
+            self._headers = copy() if copy is not None else dict(self._headers)
+            self._copied = True
+        return self._headers  # type: ignore[return-value]
+
+    def __getitem__(self, key: str) -> Any:
+        return self._headers[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._mutable()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._mutable()[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._headers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._headers)
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def __repr__(self) -> str:
+        return repr(dict(self._headers))
+
+
+def get_header(headers: Mapping[str, Any], name: str) -> Optional[str]:
+    value: Any = headers.get(name)
+    if value is None:
+        name = name.lower()
+        for key, header_value in headers.items():
+            if key.lower() == name:
+                value = header_value
+                break
+    return None if value is None else str(value)
+
+
+def parse_retry_after(headers: Mapping[str, Any]) -> Optional[float]:
+    """
+    Get the delay in seconds from ``Retry-After`` header
+    (either delay-seconds or HTTP-date).
+    """
+    value: Optional[str] = get_header(headers, "Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_reset(headers: Mapping[str, Any]) -> Optional[float]:
+    """
+    Get the delay in seconds until the quota is reset from ``X-RateLimit-*`` headers.
+    Returns None while there are requests remaining.
+    """
+    remaining: Optional[str] = get_header(headers, "X-RateLimit-Remaining")
+    reset: Optional[str] = get_header(headers, "X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+    try:
+        if float(remaining) > 0:
+            return None
+        delay: float = float(reset)
+    except ValueError:
+        return None
+    if delay > _EPOCH_THRESHOLD:
+        delay -= time.time()
+    return max(delay, 0.0)
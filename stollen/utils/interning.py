@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+# Values of these types are keyed by themselves, other ones have to be hashable
+_SCALAR_TYPES: frozenset[type[Any]] = frozenset((str, int, float, bool, bytes, type(None)))
+# Marks values, that can't be keyed, so objects containing them are kept as is
+_UNKEYED: Hashable = object()
+
+_frozen_types: dict[type[Any], bool] = {}
+
+
+def _is_frozen(model: type[BaseModel]) -> bool:
+    frozen: Optional[bool] = _frozen_types.get(model)
+    if frozen is None:
+        frozen = _frozen_types[model] = bool(model.model_config.get("frozen"))
+    return frozen
+
+
+class InternPool:
+    """
+    Pool of canonical instances of frozen objects, so that structurally equal objects
+    of the same type (e.g. the same user embedded in thousands of messages)
+    share a single instance:
+
+    .. code-block:: python
+
+        # Every response gets its own pool
+        Stollen(..., intern_objects=True)
+        # Pool shared by responses, keeping up to 10000 objects
+        Stollen(..., intern_objects=InternPool(maxsize=10_000))
+
+    Objects are compared by type, fields, extras and the bound client.
+    Mutable objects are never shared, but frozen objects nested in them are.
+    Lists and dicts inside of frozen objects are shared as well,
+    so they must not be modified in place.
+
+    Pools are thread-safe, since responses may be validated in executor threads.
+    """
+
+    maxsize: Optional[int]
+    hits: int
+    _instances: OrderedDict[Hashable, Any]
+    _lock: threading.Lock
+
+    def __init__(self, maxsize: Optional[int] = 10_000) -> None:
+        """
+        :param maxsize: Maximum number of kept objects, the least recently used ones
+            are evicted first. Not limited if None, which suits pools of a single response.
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("Pool size must be a positive integer!")
+        self.maxsize = maxsize
+        self.hits = 0
+        self._instances = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._instances.clear()
+            self.hits = 0
+
+    def intern(self, value: T) -> T:
+        """
+        Replace frozen objects in the value with their canonical instances.
+        Lists and dicts are updated in place.
+
+        :return: Canonical instance of the value, if it's a frozen object itself.
+        """
+        canonical: T = self._intern(value)[0]
+        return canonical
+
+    def intern_nested(self, value: T) -> T:
+        """
+        Same as :meth:`intern`, but the object itself is kept,
+        only the objects nested in it are replaced.
+        """
+        if isinstance(value, BaseModel):
+            self._intern_fields(value)
+        else:
+            self._intern(value)
+        return value
+
+    def _intern(self, value: Any) -> tuple[Any, Hashable]:
+        """
+        :return: Canonical value and its key for the enclosing object.
+        """
+        if isinstance(value, BaseModel):
+            return self._intern_model(value)
+        if isinstance(value, list):
+            return value, self._intern_items(value, range(len(value)))
+        if isinstance(value, dict):
+            key: Hashable = self._intern_items(value, list(value))
+            return value, key if key is _UNKEYED else (dict, tuple(value), key)
+        if type(value) is tuple:
+            items: list[Any] = list(value)
+            return tuple(items), self._intern_items(items, range(len(items)))
+        try:
+            return value, (type(value), hash(value), value)
+        except TypeError:
+            return value, _UNKEYED
+
+    def _intern_items(self, container: Any, keys: Any) -> Hashable:
+        item_keys: list[Hashable] = []
+        keyed: bool = True
+        for index in keys:
+            item: Any = container[index]
+            item_type: type[Any] = type(item)
+            # Scalars are the most of values, so they are keyed inline
+            if item_type in _SCALAR_TYPES:
+                item_keys.append(item if item_type is str else (item_type, item))
+                continue
+            canonical, item_key = self._intern(item)
+            if canonical is not item:
+                container[index] = canonical
+            if item_key is _UNKEYED:
+                keyed = False
+            item_keys.append(item_key)
+        return tuple(item_keys) if keyed else _UNKEYED
+
+    def _intern_fields(self, model: BaseModel) -> Hashable:
+        # Frozen objects are fresh from the response, so their fields are replaced directly
+        fields_key: Hashable = self._intern_items(model.__dict__, list(model.__dict__))
+        extra: Optional[dict[str, Any]] = model.__pydantic_extra__
+        if not extra:
+            return fields_key
+        extra_key: Hashable = self._intern_items(extra, list(extra))
+        if fields_key is _UNKEYED or extra_key is _UNKEYED:
+            return _UNKEYED
+        return fields_key, tuple(extra), extra_key
+
+    def _intern_model(self, model: BaseModel) -> tuple[Any, Hashable]:
+        fields_key: Hashable = self._intern_fields(model)
+        if fields_key is _UNKEYED or not _is_frozen(type(model)):
+            return model, _UNKEYED
+
+        private: Optional[dict[str, Any]] = model.__pydantic_private__
+        # Objects bound to different clients are not shared
+        bound: tuple[int, ...] = tuple(map(id, private.values())) if private else ()
+        # Fields of the same type always come in the same order, so their names are omitted
+        key: Hashable = (type(model), fields_key, bound)
+        with self._lock:
+            canonical: Any = self._instances.get(key)
+            if canonical is not None:
+                self.hits += 1
+                if self.maxsize is not None:
+                    self._instances.move_to_end(key)
+            else:
+                canonical = self._instances[key] = model
+                if self.maxsize is not None and len(self._instances) > self.maxsize:
+                    self._instances.popitem(last=False)
+        # Keys of parents refer to it by id, which is unique while parents keep it alive
+        return canonical, id(canonical)
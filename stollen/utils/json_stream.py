@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Sequence, Union
+
+_WHITESPACE = " \t\n\r"
+# Characters, that continue the number decoded so far (e.g. ``2.`` or ``1e``)
+_NUMBER_TAIL = ".eE+-"
+_decoder: json.JSONDecoder = json.JSONDecoder()
+
+
+class _IncompleteError(Exception):
+    pass
+
+
+class JsonArrayParser:
+    """
+    Incremental parser of the JSON array located at ``path`` inside the document.
+    Content is fed in chunks, and only the unparsed tail of it is kept in memory,
+    every element of the array is decoded on its own.
+
+    Documents, that are arrays themselves, are parsed regardless of the path,
+    the same way as :func:`stollen.utils.mapping.recursive_getitem` does.
+    """
+
+    path: tuple[Union[str, int], ...]
+    done: bool
+
+    def __init__(self, path: Sequence[Union[str, int]] = (), encoding: str = "utf-8") -> None:
+        self.path = tuple(path)
+        self.done = False
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        # Parsing is not retried until the buffer grows to this size
+        self._wait_size = 0
+        self._depth = 0
+        self._root = True
+        self._entered = False
+        self._first = True
+        self._index = 0
+        self._in_array = False
+
+    def _skip_whitespace(self) -> None:
+        buffer: str = self._buffer
+        pos: int = self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+
+    def _peek(self) -> str:
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            raise _IncompleteError
+        return self._buffer[self._pos]
+
+    def _expect(self, *chars: str) -> str:
+        char: str = self._peek()
+        if char not in chars:
+            msg: str = f"Expected one of {chars!r} at position {self._pos}, got {char!r}"
+            raise ValueError(msg)
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._skip_whitespace()
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._eof:
+                raise
+            raise _IncompleteError from None
+        # Numbers at the end of the buffer or cut in the middle may be continued
+        # in the next chunk
+        if not self._eof and (
+            end >= len(self._buffer)
+            or (type(value) in (int, float) and self._buffer[end] in _NUMBER_TAIL)
+        ):
+            raise _IncompleteError
+        self._pos = end
+        return value
+
+    def _seek(self) -> None:
+        if self._depth == len(self.path):
+            self._expect("[")
+            self._in_array = True
+            return
+        segment: Union[str, int] = self.path[self._depth]
+        if not self._entered:
+            char: str = self._expect("{", "[")
+            if char == "[" and self._root:
+                self._in_array = True
+                return
+            if (char == "{") != isinstance(segment, str):
+                raise KeyError(segment)
+            self._root = False
+            self._entered = True
+            self._first = True
+            self._index = 0
+            return
+        if not self._first and self._expect(",", "}", "]") != ",":
+            raise KeyError(segment)
+        if isinstance(segment, str):
+            key: Any = self._value()
+            self._expect(":")
+            if key == segment:
+                self._descend()
+                return
+        elif self._index == segment:
+            self._descend()
+            return
+        self._value()
+        self._first = False
+        self._index += 1
+
+    def _descend(self) -> None:
+        self._depth += 1
+        self._entered = False
+
+    def _item(self) -> tuple[bool, Any]:
+        if self._first:
+            if self._peek() == "]":
+                self._pos += 1
+                self.done = True
+                return False, None
+        elif self._expect(",", "]") == "]":
+            self.done = True
+            return False, None
+        value: Any = self._value()
+        self._first = False
+        return True, value
+
+    def _parse(self) -> list[Any]:
+        items: list[Any] = []
+        while not self.done:
+            start: int = self._pos
+            try:
+                if not self._in_array:
+                    self._seek()
+                    if self._in_array:
+                        self._first = True
+                    continue
+                found, item = self._item()
+            except _IncompleteError:
+                self._pos = start
+                self._wait_size = 2 * (len(self._buffer) - start)
+                break
+            if found:
+                items.append(item)
+        # Parsed content is dropped, so that the buffer holds the current element only
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        return items
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Feed the next chunk of content and get the array elements completed by it.
+        """
+        if self.done:
+            return []
+        self._buffer += self._decoder.decode(chunk)
+        if len(self._buffer) < self._wait_size:
+            return []
+        return self._parse()
+
+    def close(self) -> list[Any]:
+        """
+        Mark the content as finished and get the rest of array elements.
+        """
+        if self.done:
+            return []
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        items: list[Any] = self._parse()
+        if not self.done:
+            raise ValueError("Content has ended before the end of JSON array")
+        return items
@@ -1,14 +1,17 @@
 import json
 import re
+from typing import Any, Protocol
 
-from pydantic import BaseModel
+
+class Dumpable(Protocol):
+    def model_dump(self) -> dict[str, Any]: ...
 
 
 def camel_to_snake(string: str) -> str:
     return re.sub(r"(?<!^)(?=[A-Z])", "_", string).lower()
 
 
-def serialize_model(model: BaseModel) -> str:
+def serialize_model(model: Dumpable) -> str:
     return "\n".join(
         [
             f"  {field}={json.dumps(value, indent=4, default=str, ensure_ascii=False)}"
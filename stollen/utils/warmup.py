@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import chain
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+if TYPE_CHECKING:
+    from ..method import StollenMethod
+
+T = TypeVar("T")
+
+
+@dataclass()
+class WarmupReport:
+    """
+    Schema build times in seconds by the qualified name of the method, object or adapter,
+    schemas, that can't be built yet (e.g. because of unresolved forward references),
+    are reported in ``errors``.
+    """
+
+    durations: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def total(self) -> float:
+        return sum(self.durations.values())
+
+    def slowest(self, count: int = 10) -> list[tuple[str, float]]:
+        return sorted(self.durations.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def _subclasses(cls: type[T]) -> Iterator[type[T]]:
+    seen: set[type[Any]] = set()
+    stack: list[type[Any]] = [cls]
+    while stack:
+        for subclass in stack.pop().__subclasses__():
+            if subclass not in seen:
+                seen.add(subclass)
+                stack.append(subclass)
+                yield subclass
+
+
+def _name(cls: type[Any]) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _measure(report: WarmupReport, name: str, build: Callable[[], Any]) -> None:
+    start: float = perf_counter()
+    try:
+        build()
+    except Exception as error:
+        report.errors[name] = error
+    else:
+        report.durations[name] = perf_counter() - start
+
+
+def warmup_schemas(
+    methods: Optional[Iterable[type[StollenMethod[Any, Any]]]] = None,
+    objects: Optional[Iterable[type[BaseModel]]] = None,
+) -> WarmupReport:
+    """
+    Build schemas of objects, methods and their response adapters, which are deferred by default,
+    so that the first requests don't pay for it.
+
+    :param methods: Methods to warm up, all the declared methods by default.
+    :param objects: Objects to warm up, all the declared objects by default.
+    """
+    from ..method import StollenMethod
+    from ..object import LazyStollenObject, StollenObject
+
+    report: WarmupReport = WarmupReport()
+    if objects is None:
+        objects = chain(_subclasses(StollenObject), _subclasses(LazyStollenObject))
+    # Objects go first, so that adapters of methods reuse their schemas
+    for obj in objects:
+        if not obj.__pydantic_complete__:
+            _measure(report, _name(obj), obj.model_rebuild)
+
+    adapters: set[int] = set()
+    for method in methods if methods is not None else _subclasses(StollenMethod):
+        if not method.__pydantic_complete__:
+            _measure(report, _name(method), method.model_rebuild)
+        # Adapters are inherited by methods, that don't declare own returning type
+        adapter: Optional[TypeAdapter[Any]] = method.__dict__.get("type_adapter")
+        if adapter is None or id(adapter) in adapters:
+            continue
+        adapters.add(id(adapter))
+        _measure(report, f"{_name(method)}.type_adapter", adapter.rebuild)
+    return report
+
+
+async def warmup(
+    methods: Optional[Iterable[type[StollenMethod[Any, Any]]]] = None,
+    objects: Optional[Iterable[type[BaseModel]]] = None,
+    executor: Optional[Executor] = None,
+) -> WarmupReport:
+    """
+    Same as :func:`warmup_schemas`, but schemas are built in a thread,
+    so that the event loop keeps serving while the application starts.
+    Schemas are built one by one, since their building holds the GIL anyway.
+
+    :param methods: Methods to warm up, all the declared methods by default.
+    :param objects: Objects to warm up, all the declared objects by default.
+    :param executor: Executor to build schemas in, the default one of the loop by default.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        executor,
+        partial(warmup_schemas, methods=methods, objects=objects),
+    )
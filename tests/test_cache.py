@@ -0,0 +1,53 @@
+import asyncio
+
+from aiohttp import web
+
+from stollen import Stollen, StollenMethod, StollenObject
+from stollen.enums import HTTPMethod
+
+from .utils import serve
+
+
+class Item(StollenObject[Stollen]):
+    id: int
+
+
+class CachedItem(
+    StollenMethod[Item, Stollen],
+    http_method=HTTPMethod.GET,
+    api_method="/item",
+    returning=Item,
+    cache_ttl=60,
+):
+    pass
+
+
+class RawItem(
+    StollenMethod[dict, Stollen],
+    http_method=HTTPMethod.GET,
+    api_method="/item",
+    returning=dict,
+    cache_ttl=60,
+):
+    pass
+
+
+def test_methods_sharing_endpoint_are_cached_separately() -> None:
+    hits: list[str] = []
+
+    async def item(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        return web.json_response({"id": 1})
+
+    async def main() -> None:
+        async with serve({"/item": item}) as url:
+            async with Stollen(base_url=url, echo_requests=False) as client:
+                cached: Item = await client(CachedItem())
+                raw: dict = await client(RawItem())
+                assert isinstance(cached, Item)
+                assert raw == {"id": 1}
+                assert await client(CachedItem()) is cached
+                assert await client(RawItem()) == {"id": 1}
+
+    asyncio.run(main())
+    assert len(hits) == 2
@@ -0,0 +1,57 @@
+import asyncio
+
+from aiohttp import web
+
+from stollen import Stollen, StollenMethod, StollenObject
+from stollen.enums import HTTPMethod
+
+from .utils import serve
+
+
+class Item(StollenObject[Stollen]):
+    id: int
+
+
+class GetItem(
+    StollenMethod[Item, Stollen],
+    http_method=HTTPMethod.GET,
+    api_method="/item",
+    returning=Item,
+):
+    pass
+
+
+class GetRawItem(
+    StollenMethod[dict, Stollen],
+    http_method=HTTPMethod.GET,
+    api_method="/item",
+    returning=dict,
+):
+    pass
+
+
+def test_concurrent_calls_are_coalesced_by_method() -> None:
+    hits: list[str] = []
+
+    async def item(request: web.Request) -> web.Response:
+        hits.append(request.path)
+        await asyncio.sleep(0.05)
+        return web.json_response({"id": 1})
+
+    async def main() -> None:
+        async with serve({"/item": item}) as url:
+            async with Stollen(
+                base_url=url, echo_requests=False, coalesce_requests=True
+            ) as client:
+                results = await asyncio.gather(
+                    client(GetItem()),
+                    client(GetRawItem()),
+                    client(GetItem()),
+                    client(GetRawItem()),
+                )
+        assert [type(result) for result in results] == [Item, dict, Item, dict]
+        assert results[0] is results[2]
+        assert results[1] is results[3]
+
+    asyncio.run(main())
+    assert len(hits) == 2
@@ -0,0 +1,152 @@
+import asyncio
+from typing import Any
+
+import pytest
+from aiohttp import web
+
+from stollen import Stollen, StollenMethod
+from stollen.enums import HTTPMethod
+from stollen.utils.concurrency import map_bounded
+
+from .utils import serve
+
+
+class Tracker:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.started: list[int] = []
+        self.cancelled: list[int] = []
+
+    async def sleep(self, value: int, delay: float) -> int:
+        self.started.append(value)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(value)
+            raise
+        finally:
+            self.in_flight -= 1
+        return value
+
+
+def test_map_bounded_limits_concurrency() -> None:
+    tracker = Tracker()
+
+    async def main() -> list[tuple[int, int, Any]]:
+        return [
+            result
+            async for result in map_bounded(
+                lambda value: tracker.sleep(value, 0.01 * (value % 3)), range(10), limit=3
+            )
+        ]
+
+    results = asyncio.run(main())
+    assert tracker.peak == 3
+    assert sorted(results) == [(i, i, i) for i in range(10)]
+
+
+def test_map_bounded_pulls_items_lazily() -> None:
+    pulled: list[int] = []
+    tracker = Tracker()
+
+    def items() -> Any:
+        for value in range(100):
+            pulled.append(value)
+            yield value
+
+    async def main() -> None:
+        generator = map_bounded(lambda value: tracker.sleep(value, 0.01), items(), limit=2)
+        async for _ in generator:
+            break
+        await generator.aclose()
+
+    asyncio.run(main())
+    assert len(pulled) <= 3
+
+
+def test_map_bounded_cancels_pending_tasks_after_break() -> None:
+    tracker = Tracker()
+
+    async def main() -> None:
+        generator = map_bounded(
+            lambda value: tracker.sleep(value, 0.01 if value == 0 else 10), range(5), limit=5
+        )
+        async for index, _, _ in generator:
+            assert index == 0
+            break
+        await generator.aclose()
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert sorted(tracker.cancelled) == [1, 2, 3, 4]
+    assert tracker.in_flight == 0
+
+
+def test_map_bounded_first_error_stops_the_run() -> None:
+    tracker = Tracker()
+
+    async def func(value: int) -> int:
+        if value == 1:
+            raise RuntimeError("boom")
+        return await tracker.sleep(value, 10)
+
+    async def main() -> None:
+        async for _ in map_bounded(func, range(4), limit=4):
+            pass
+
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(main())
+    assert sorted(tracker.cancelled) == [0, 2, 3]
+
+
+def test_map_bounded_returns_exceptions() -> None:
+    async def func(value: int) -> int:
+        if value % 2:
+            raise ValueError(value)
+        return value
+
+    async def main() -> list[Any]:
+        results: list[Any] = [None] * 4
+        async for index, _, result in map_bounded(func, range(4), limit=2, return_exceptions=True):
+            results[index] = result
+        return results
+
+    results = asyncio.run(main())
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError) and isinstance(results[3], ValueError)
+
+
+class GetDelayed(
+    StollenMethod[int, Stollen],
+    http_method=HTTPMethod.GET,
+    api_method="/delayed/{value}",
+    returning=int,
+):
+    value: int
+
+
+def test_gather_keeps_order_and_limit() -> None:
+    tracker = Tracker()
+
+    async def delayed(request: web.Request) -> web.Response:
+        value: int = int(request.match_info["value"])
+        # Later methods complete first
+        await tracker.sleep(value, 0.01 * (10 - value))
+        return web.json_response(value)
+
+    async def main() -> None:
+        async with serve({"/delayed/{value}": delayed}) as url:
+            async with Stollen(base_url=url, echo_requests=False) as client:
+                methods = [GetDelayed(value=value) for value in range(10)]
+                assert await client.gather(methods, concurrency=4) == list(range(10))
+
+                completed: list[int] = [
+                    result async for _, result in client.map_concurrent(methods[:4], concurrency=4)
+                ]
+                assert completed == [3, 2, 1, 0]
+
+    asyncio.run(main())
+    assert tracker.peak == 4
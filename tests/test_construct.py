@@ -0,0 +1,120 @@
+import asyncio
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Optional, Union
+
+import pytest
+from pydantic import Field, TypeAdapter
+
+from stollen import Stollen, StollenMethod, StollenObject
+from stollen.enums import HTTPMethod
+from stollen.exceptions import DetailedStollenAPIError
+from stollen.requests import StollenRequest, StollenResponse
+from stollen.utils.construct import ConstructError, construct
+
+
+class Color(str, Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+class User(StollenObject[Stollen]):
+    id: int
+    name: str
+    is_bot: bool = False
+
+
+class Message(StollenObject[Stollen]):
+    message_id: int = Field(alias="id")
+    date: datetime
+    color: Color
+    author: User
+    reply_to: Optional[User] = None
+    tags: list[str] = []
+    mentions: list[User] = []
+    reactions: dict[str, int] = {}
+    payload: Union[int, str, None] = None
+
+
+class GetMessage(
+    StollenMethod[Message, Stollen],
+    http_method=HTTPMethod.GET,
+    api_method="/message",
+    returning=Message,
+    trusted=True,
+):
+    pass
+
+
+MESSAGE: dict[str, Any] = {
+    "id": 1,
+    "date": 1700000000,
+    "color": "red",
+    "author": {"id": 2, "name": "Alice", "language": "en"},
+    "mentions": [{"id": 3, "name": "Bob", "is_bot": True}],
+    "reactions": {"+1": 5},
+    "payload": "7",
+    "unknown": {"nested": [1, 2]},
+}
+
+CASES: list[tuple[Any, Any]] = [
+    (Message, MESSAGE),
+    (Message, {**MESSAGE, "reply_to": {"id": 4, "name": "Eve"}, "tags": ["a", "b"]}),
+    (list[Message], [MESSAGE, {**MESSAGE, "id": 2, "color": "blue", "payload": None}]),
+    (dict[str, User], {"alice": {"id": 2, "name": "Alice"}}),
+    (Optional[User], None),
+    (list[int], [1, 2, 3]),
+]
+
+
+@pytest.mark.parametrize(("annotation", "data"), CASES)
+def test_construct_matches_validation(annotation: Any, data: Any) -> None:
+    client: Stollen = Stollen(base_url="https://example.com")
+    validated: Any = TypeAdapter(annotation).validate_python(data, context={"client": client})
+    constructed: Any = construct(annotation, data, client)
+
+    assert constructed == validated
+    assert TypeAdapter(annotation).dump_python(constructed) == TypeAdapter(annotation).dump_python(
+        validated
+    )
+
+
+def test_construct_keeps_extras_and_binds_client() -> None:
+    client: Stollen = Stollen(base_url="https://example.com")
+    message: Message = construct(Message, MESSAGE, client)
+
+    assert message.model_extra == {"unknown": {"nested": [1, 2]}}
+    assert message.author.model_extra == {"language": "en"}
+    assert message.client is client
+    assert message.author.client is client
+    assert message.mentions[0].client is client
+    assert message.date == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("data", [None, 1, {"id": 1, "author": None}, {"id": 1, "mentions": 5}])
+def test_construct_rejects_malformed_data(data: Any) -> None:
+    with pytest.raises(ConstructError):
+        construct(Message, data, None)
+
+
+def test_construct_rejects_unknown_enum_value() -> None:
+    with pytest.raises(ConstructError, match="ValueError"):
+        construct(list[Color], ["red", "green"], None)
+
+
+def test_malformed_trusted_response_is_detailed_error() -> None:
+    client: Stollen = Stollen(base_url="https://example.com")
+    request: StollenRequest = StollenRequest(url="https://example.com/message", http_method="GET")
+    response: StollenResponse = StollenResponse(status_code=200, body=None)
+
+    with pytest.raises(DetailedStollenAPIError) as error:
+        asyncio.run(
+            client.session.validate(
+                client=client,
+                method=GetMessage(),
+                request=request,
+                response=response,
+                data=None,
+            )
+        )
+    assert isinstance(error.value.__cause__, ConstructError)
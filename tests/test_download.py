@@ -0,0 +1,93 @@
+import asyncio
+import re
+from pathlib import Path
+from typing import Optional
+
+from aiohttp import web
+
+from stollen import Stollen
+from stollen.enums import HTTPMethod
+from stollen.method import StollenStreamingMethod
+
+from .utils import Handler, serve
+
+CONTENT: bytes = bytes(range(256)) * 400
+RANGE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+class GetFile(
+    StollenStreamingMethod[Stollen],
+    http_method=HTTPMethod.GET,
+    api_method="/file",
+):
+    pass
+
+
+def parse_range(request: web.Request) -> tuple[int, int]:
+    match: Optional[re.Match[str]] = RANGE.fullmatch(request.headers["Range"])
+    assert match is not None
+    start, end = match.groups()
+    return int(start), int(end) if end else len(CONTENT) - 1
+
+
+def download(handler: Handler, path: Path, segments: int) -> int:
+    async def main() -> int:
+        async with serve({"/file": handler}) as url:
+            async with Stollen(base_url=url, echo_requests=False) as client:
+                return await GetFile().download_to(path, segments=segments, client=client)
+
+    return asyncio.run(main())
+
+
+def test_download_without_range_support(tmp_path: Path) -> None:
+    requests: list[Optional[str]] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        requests.append(request.headers.get("Range"))
+        return web.Response(body=CONTENT)
+
+    path: Path = tmp_path / "file"
+    assert download(handler, path, segments=4) == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+    # The whole content is streamed by the probe request
+    assert requests == ["bytes=0-"]
+
+
+def test_download_resumes_interrupted_segment(tmp_path: Path) -> None:
+    ranges: list[tuple[int, int]] = []
+    interrupted: list[int] = []
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        start, end = parse_range(request)
+        ranges.append((start, end))
+        body: bytes = CONTENT[start : end + 1]
+        response: web.StreamResponse = web.StreamResponse(
+            status=206,
+            headers={"Content-Range": f"bytes {start}-{end}/{len(CONTENT)}"},
+        )
+        response.content_length = len(body)
+        await response.prepare(request)
+        if start and not interrupted:
+            # The connection drops in the middle of the first non-probe segment
+            interrupted.append(start)
+            await response.write(body[: len(body) // 2])
+            await asyncio.sleep(0.05)
+            assert request.transport is not None
+            request.transport.close()
+            return response
+        await response.write(body)
+        await response.write_eof()
+        return response
+
+    path: Path = tmp_path / "file"
+    assert download(handler, path, segments=4) == len(CONTENT)
+    assert path.read_bytes() == CONTENT
+
+    segment_start: int = interrupted[0]
+    segment_end: int = next(end for start, end in ranges if start == segment_start)
+    resumed: list[int] = [
+        start for start, end in ranges if end == segment_end and start != segment_start
+    ]
+    # The segment is requested again from the last written byte only
+    assert len(resumed) == 1
+    assert segment_start < resumed[0] <= segment_end
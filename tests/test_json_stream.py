@@ -0,0 +1,52 @@
+from typing import Any, Union
+
+import pytest
+
+from stollen.utils.json_stream import JsonArrayParser
+
+CASES: list[tuple[bytes, tuple[Union[str, int], ...], list[Any]]] = [
+    (b"[1, 2.5]", (), [1, 2.5]),
+    (b"[1e3]", (), [1000.0]),
+    (b"[-0.5e-2, 10, 3E+2, true, null]", (), [-0.005, 10, 300.0, True, None]),
+    (
+        b'{"total": 2.5e1, "page": -12, "items": [{"a": 1.25}, "\xc3\xa9", 7]}',
+        ("items",),
+        [{"a": 1.25}, "\xe9", 7],
+    ),
+    (b'{"data": [[0.5], [1e-3, 22]]}', ("data", 1), [0.001, 22]),
+]
+
+
+def parse(chunks: list[bytes], path: tuple[Union[str, int], ...]) -> list[Any]:
+    parser: JsonArrayParser = JsonArrayParser(path)
+    items: list[Any] = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return items
+
+
+@pytest.mark.parametrize(("content", "path", "expected"), CASES)
+def test_every_split_offset(
+    content: bytes,
+    path: tuple[Union[str, int], ...],
+    expected: list[Any],
+) -> None:
+    for offset in range(len(content) + 1):
+        assert parse([content[:offset], content[offset:]], path) == expected, offset
+
+
+@pytest.mark.parametrize(("content", "path", "expected"), CASES)
+def test_byte_by_byte(
+    content: bytes,
+    path: tuple[Union[str, int], ...],
+    expected: list[Any],
+) -> None:
+    chunks: list[bytes] = [content[i : i + 1] for i in range(len(content))]
+    assert parse(chunks, path) == expected
+
+
+@pytest.mark.parametrize("content", [b"[1.]", b"[1e]", b"[1, 2"])
+def test_malformed_content(content: bytes) -> None:
+    with pytest.raises(ValueError):
+        parse([content], ())
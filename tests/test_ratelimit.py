@@ -0,0 +1,25 @@
+import asyncio
+import time
+
+from stollen.session.ratelimit import Rate, TokenBucket
+
+
+def test_block_does_not_refill_tokens() -> None:
+    bucket: TokenBucket = TokenBucket(Rate(limit=10, burst=5))
+
+    async def main() -> list[float]:
+        acquired: list[float] = []
+        for _ in range(5):
+            await bucket.acquire()
+        bucket.block(0.2)
+        blocked_until: float = time.monotonic() + 0.2
+        for _ in range(3):
+            await bucket.acquire()
+            acquired.append(time.monotonic() - blocked_until)
+        return acquired
+
+    acquired: list[float] = asyncio.run(main())
+    # Tokens refill at the rate once the block ends, instead of a burst of saved up ones
+    assert acquired[0] >= 0.09
+    assert acquired[1] - acquired[0] >= 0.09
+    assert acquired[2] - acquired[1] >= 0.09
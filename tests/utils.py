@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@asynccontextmanager
+async def serve(routes: dict[str, Handler]) -> AsyncIterator[str]:
+    """
+    Run a local server with GET and POST routes and yield its base URL.
+    """
+    app: web.Application = web.Application()
+    for path, handler in routes.items():
+        app.router.add_route("*", path, handler)
+    server: TestServer = TestServer(app, port=0)
+    await server.start_server()
+    try:
+        yield f"http://127.0.0.1:{server.port}"
+    finally:
+        await server.close()